@@ -2,96 +2,349 @@
 // Optimized: 69 images (WebP) + 12 videos (Compressed MP4)
 
 const MEDIA_DATA = {
-  profile: {
-    username: 'anhkhoiii_090',
-    profilePic: 'assets/media/optimized/anhkhoiii_090_2025-12-06_05-08-27_UTC_profile_pic.webp'
+  "profile": {
+    "username": "anhkhoiii_090",
+    "profilePic": "assets/media/optimized/anhkhoiii_090_2025-12-06_05-08-27_UTC_profile_pic.webp"
   },
-  
-  images: [
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_1.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_2.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_3.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_4.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_5.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_6.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-11-08_12-11-37_UTC_7.webp', date: '2025-11-08' },
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_1.webp', date: '2025-09-08' },
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_2.webp', date: '2025-09-08' },
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_4.webp', date: '2025-09-08' },
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_5.webp', date: '2025-09-08' },
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_6.webp', date: '2025-09-08' },
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_7.webp', date: '2025-09-08' },
-    { src: 'assets/media/optimized/2025-07-06_14-09-53_UTC_1.webp', date: '2025-07-06' },
-    { src: 'assets/media/optimized/2025-07-06_14-09-53_UTC_2.webp', date: '2025-07-06' },
-    { src: 'assets/media/optimized/2025-05-19_16-11-23_UTC_1.webp', date: '2025-05-19' },
-    { src: 'assets/media/optimized/2025-05-19_16-11-23_UTC_3.webp', date: '2025-05-19' },
-    { src: 'assets/media/optimized/2025-05-19_16-11-23_UTC_4.webp', date: '2025-05-19' },
-    { src: 'assets/media/optimized/2025-05-19_16-11-23_UTC_5.webp', date: '2025-05-19' },
-    { src: 'assets/media/optimized/2025-04-14_09-26-31_UTC_1.webp', date: '2025-04-14' },
-    { src: 'assets/media/optimized/2025-04-14_09-26-31_UTC_2.webp', date: '2025-04-14' },
-    { src: 'assets/media/optimized/2025-04-14_09-26-31_UTC_4.webp', date: '2025-04-14' },
-    { src: 'assets/media/optimized/2025-04-14_09-26-31_UTC_6.webp', date: '2025-04-14' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_1.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_2.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_3.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_4.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_5.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_6.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_7.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-12-31_08-49-28_UTC_8.webp', date: '2024-12-31' },
-    { src: 'assets/media/optimized/2024-07-16_05-22-22_UTC_1.webp', date: '2024-07-16' },
-    { src: 'assets/media/optimized/2024-07-16_05-22-22_UTC_2.webp', date: '2024-07-16' },
-    { src: 'assets/media/optimized/2024-07-16_05-22-22_UTC_3.webp', date: '2024-07-16' },
-    { src: 'assets/media/optimized/2024-07-16_05-22-22_UTC_5.webp', date: '2024-07-16' },
-    { src: 'assets/media/optimized/2024-07-16_05-22-22_UTC_6.webp', date: '2024-07-16' },
-    { src: 'assets/media/optimized/2024-07-08_06-53-37_UTC_1.webp', date: '2024-07-08' },
-    { src: 'assets/media/optimized/2024-07-08_06-53-37_UTC_2.webp', date: '2024-07-08' },
-    { src: 'assets/media/optimized/2024-07-08_06-53-37_UTC_3.webp', date: '2024-07-08' },
-    { src: 'assets/media/optimized/2024-07-08_06-53-37_UTC_4.webp', date: '2024-07-08' },
-    { src: 'assets/media/optimized/2024-07-08_06-53-37_UTC_5.webp', date: '2024-07-08' },
-    { src: 'assets/media/optimized/2024-07-08_06-53-37_UTC_6.webp', date: '2024-07-08' },
-    { src: 'assets/media/optimized/2024-06-05_10-35-02_UTC_1.webp', date: '2024-06-05' },
-    { src: 'assets/media/optimized/2024-06-05_10-35-02_UTC_2.webp', date: '2024-06-05' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_1.webp', date: '2024-04-19' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_2.webp', date: '2024-04-19' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_3.webp', date: '2024-04-19' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_4.webp', date: '2024-04-19' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_5.webp', date: '2024-04-19' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_6.webp', date: '2024-04-19' },
-    { src: 'assets/media/optimized/2024-03-18_04-05-40_UTC_1.webp', date: '2024-03-18' },
-    { src: 'assets/media/optimized/2024-03-18_04-05-40_UTC_2.webp', date: '2024-03-18' },
-    { src: 'assets/media/optimized/2024-03-18_04-05-40_UTC_3.webp', date: '2024-03-18' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_1.webp', date: '2024-03-04' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_2.webp', date: '2024-03-04' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_3.webp', date: '2024-03-04' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_5.webp', date: '2024-03-04' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_7.webp', date: '2024-03-04' },
-    { src: 'assets/media/optimized/2024-02-19_02-47-10_UTC_1.webp', date: '2024-02-19' },
-    { src: 'assets/media/optimized/2024-02-19_02-47-10_UTC_2.webp', date: '2024-02-19' },
-    { src: 'assets/media/optimized/2024-02-19_02-47-10_UTC_3.webp', date: '2024-02-19' },
-    { src: 'assets/media/optimized/2024-02-19_02-47-10_UTC_5.webp', date: '2024-02-19' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_1.webp', date: '2023-11-25' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_2.webp', date: '2023-11-25' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_3.webp', date: '2023-11-25' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_4.webp', date: '2023-11-25' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_5.webp', date: '2023-11-25' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_6.webp', date: '2023-11-25' },
-    { src: 'assets/media/optimized/2023-11-25_01-51-41_UTC_7.webp', date: '2023-11-25' }
+  "images": [
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_1.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_2.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_3.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_4.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_5.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_6.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-11-08_12-11-37_UTC_7.webp",
+      "date": "2025-11-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_1.webp",
+      "date": "2025-09-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_2.webp",
+      "date": "2025-09-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_4.webp",
+      "date": "2025-09-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_5.webp",
+      "date": "2025-09-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_6.webp",
+      "date": "2025-09-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_7.webp",
+      "date": "2025-09-08"
+    },
+    {
+      "src": "assets/media/optimized/2025-07-06_14-09-53_UTC_1.webp",
+      "date": "2025-07-06"
+    },
+    {
+      "src": "assets/media/optimized/2025-07-06_14-09-53_UTC_2.webp",
+      "date": "2025-07-06"
+    },
+    {
+      "src": "assets/media/optimized/2025-05-19_16-11-23_UTC_1.webp",
+      "date": "2025-05-19"
+    },
+    {
+      "src": "assets/media/optimized/2025-05-19_16-11-23_UTC_3.webp",
+      "date": "2025-05-19"
+    },
+    {
+      "src": "assets/media/optimized/2025-05-19_16-11-23_UTC_4.webp",
+      "date": "2025-05-19"
+    },
+    {
+      "src": "assets/media/optimized/2025-05-19_16-11-23_UTC_5.webp",
+      "date": "2025-05-19"
+    },
+    {
+      "src": "assets/media/optimized/2025-04-14_09-26-31_UTC_1.webp",
+      "date": "2025-04-14"
+    },
+    {
+      "src": "assets/media/optimized/2025-04-14_09-26-31_UTC_2.webp",
+      "date": "2025-04-14"
+    },
+    {
+      "src": "assets/media/optimized/2025-04-14_09-26-31_UTC_4.webp",
+      "date": "2025-04-14"
+    },
+    {
+      "src": "assets/media/optimized/2025-04-14_09-26-31_UTC_6.webp",
+      "date": "2025-04-14"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_1.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_2.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_3.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_4.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_5.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_6.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_7.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-12-31_08-49-28_UTC_8.webp",
+      "date": "2024-12-31"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-16_05-22-22_UTC_1.webp",
+      "date": "2024-07-16"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-16_05-22-22_UTC_2.webp",
+      "date": "2024-07-16"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-16_05-22-22_UTC_3.webp",
+      "date": "2024-07-16"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-16_05-22-22_UTC_5.webp",
+      "date": "2024-07-16"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-16_05-22-22_UTC_6.webp",
+      "date": "2024-07-16"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-08_06-53-37_UTC_1.webp",
+      "date": "2024-07-08"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-08_06-53-37_UTC_2.webp",
+      "date": "2024-07-08"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-08_06-53-37_UTC_3.webp",
+      "date": "2024-07-08"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-08_06-53-37_UTC_4.webp",
+      "date": "2024-07-08"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-08_06-53-37_UTC_5.webp",
+      "date": "2024-07-08"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-08_06-53-37_UTC_6.webp",
+      "date": "2024-07-08"
+    },
+    {
+      "src": "assets/media/optimized/2024-06-05_10-35-02_UTC_1.webp",
+      "date": "2024-06-05"
+    },
+    {
+      "src": "assets/media/optimized/2024-06-05_10-35-02_UTC_2.webp",
+      "date": "2024-06-05"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_1.webp",
+      "date": "2024-04-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_2.webp",
+      "date": "2024-04-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_3.webp",
+      "date": "2024-04-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_4.webp",
+      "date": "2024-04-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_5.webp",
+      "date": "2024-04-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_6.webp",
+      "date": "2024-04-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-18_04-05-40_UTC_1.webp",
+      "date": "2024-03-18"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-18_04-05-40_UTC_2.webp",
+      "date": "2024-03-18"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-18_04-05-40_UTC_3.webp",
+      "date": "2024-03-18"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_1.webp",
+      "date": "2024-03-04"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_2.webp",
+      "date": "2024-03-04"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_3.webp",
+      "date": "2024-03-04"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_5.webp",
+      "date": "2024-03-04"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_7.webp",
+      "date": "2024-03-04"
+    },
+    {
+      "src": "assets/media/optimized/2024-02-19_02-47-10_UTC_1.webp",
+      "date": "2024-02-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-02-19_02-47-10_UTC_2.webp",
+      "date": "2024-02-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-02-19_02-47-10_UTC_3.webp",
+      "date": "2024-02-19"
+    },
+    {
+      "src": "assets/media/optimized/2024-02-19_02-47-10_UTC_5.webp",
+      "date": "2024-02-19"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_1.webp",
+      "date": "2023-11-25"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_2.webp",
+      "date": "2023-11-25"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_3.webp",
+      "date": "2023-11-25"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_4.webp",
+      "date": "2023-11-25"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_5.webp",
+      "date": "2023-11-25"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_6.webp",
+      "date": "2023-11-25"
+    },
+    {
+      "src": "assets/media/optimized/2023-11-25_01-51-41_UTC_7.webp",
+      "date": "2023-11-25"
+    }
   ],
-
-  videos: [
-    { src: 'assets/media/optimized/2025-09-08_16-42-50_UTC_3.mp4', date: '2025-09-08', poster: 'assets/media/thumbnails/2025-09-08_16-42-50_UTC_3_poster.jpg' },
-    { src: 'assets/media/optimized/2025-07-06_14-09-53_UTC_3.mp4', date: '2025-07-06', poster: 'assets/media/thumbnails/2025-07-06_14-09-53_UTC_3_poster.jpg' },
-    { src: 'assets/media/optimized/2025-07-06_14-09-53_UTC_4.mp4', date: '2025-07-06', poster: 'assets/media/thumbnails/2025-07-06_14-09-53_UTC_4_poster.jpg' },
-    { src: 'assets/media/optimized/2025-06-15_14-13-35_UTC.mp4', date: '2025-06-15', poster: 'assets/media/thumbnails/2025-06-15_14-13-35_UTC_poster.jpg' },
-    { src: 'assets/media/optimized/2025-05-19_16-11-23_UTC_2.mp4', date: '2025-05-19', poster: 'assets/media/thumbnails/2025-05-19_16-11-23_UTC_2_poster.jpg' },
-    { src: 'assets/media/optimized/2025-04-14_09-26-31_UTC_3.mp4', date: '2025-04-14', poster: 'assets/media/thumbnails/2025-04-14_09-26-31_UTC_3_poster.jpg' },
-    { src: 'assets/media/optimized/2025-04-14_09-26-31_UTC_5.mp4', date: '2025-04-14', poster: 'assets/media/thumbnails/2025-04-14_09-26-31_UTC_5_poster.jpg' },
-    { src: 'assets/media/optimized/2024-07-16_05-22-22_UTC_4.mp4', date: '2024-07-16', poster: 'assets/media/thumbnails/2024-07-16_05-22-22_UTC_4_poster.jpg' },
-    { src: 'assets/media/optimized/2024-04-19_09-25-08_UTC_7.mp4', date: '2024-04-19', poster: 'assets/media/thumbnails/2024-04-19_09-25-08_UTC_7_poster.jpg' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_4.mp4', date: '2024-03-04', poster: 'assets/media/thumbnails/2024-03-04_05-16-17_UTC_4_poster.jpg' },
-    { src: 'assets/media/optimized/2024-03-04_05-16-17_UTC_6.mp4', date: '2024-03-04', poster: 'assets/media/thumbnails/2024-03-04_05-16-17_UTC_6_poster.jpg' },
-    { src: 'assets/media/optimized/2024-02-19_02-47-10_UTC_4.mp4', date: '2024-02-19', poster: 'assets/media/thumbnails/2024-02-19_02-47-10_UTC_4_poster.jpg' }
+  "videos": [
+    {
+      "src": "assets/media/optimized/2025-09-08_16-42-50_UTC_3.mp4",
+      "date": "2025-09-08",
+      "poster": "assets/media/thumbnails/2025-09-08_16-42-50_UTC_3_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2025-07-06_14-09-53_UTC_3.mp4",
+      "date": "2025-07-06",
+      "poster": "assets/media/thumbnails/2025-07-06_14-09-53_UTC_3_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2025-07-06_14-09-53_UTC_4.mp4",
+      "date": "2025-07-06",
+      "poster": "assets/media/thumbnails/2025-07-06_14-09-53_UTC_4_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2025-06-15_14-13-35_UTC.mp4",
+      "date": "2025-06-15",
+      "poster": "assets/media/thumbnails/2025-06-15_14-13-35_UTC_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2025-05-19_16-11-23_UTC_2.mp4",
+      "date": "2025-05-19",
+      "poster": "assets/media/thumbnails/2025-05-19_16-11-23_UTC_2_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2025-04-14_09-26-31_UTC_3.mp4",
+      "date": "2025-04-14",
+      "poster": "assets/media/thumbnails/2025-04-14_09-26-31_UTC_3_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2025-04-14_09-26-31_UTC_5.mp4",
+      "date": "2025-04-14",
+      "poster": "assets/media/thumbnails/2025-04-14_09-26-31_UTC_5_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2024-07-16_05-22-22_UTC_4.mp4",
+      "date": "2024-07-16",
+      "poster": "assets/media/thumbnails/2024-07-16_05-22-22_UTC_4_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2024-04-19_09-25-08_UTC_7.mp4",
+      "date": "2024-04-19",
+      "poster": "assets/media/thumbnails/2024-04-19_09-25-08_UTC_7_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_4.mp4",
+      "date": "2024-03-04",
+      "poster": "assets/media/thumbnails/2024-03-04_05-16-17_UTC_4_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2024-03-04_05-16-17_UTC_6.mp4",
+      "date": "2024-03-04",
+      "poster": "assets/media/thumbnails/2024-03-04_05-16-17_UTC_6_poster.jpg"
+    },
+    {
+      "src": "assets/media/optimized/2024-02-19_02-47-10_UTC_4.mp4",
+      "date": "2024-02-19",
+      "poster": "assets/media/thumbnails/2024-02-19_02-47-10_UTC_4_poster.jpg"
+    }
   ]
 };
 
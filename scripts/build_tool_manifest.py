@@ -0,0 +1,68 @@
+"""
+Build src/tools/_manifest.py
+Records every public tool function so the agent can register tools without
+scanning and inspecting each module at startup, plus each module's mtime and
+size so the agent can tell when the manifest is stale. Re-run after editing
+any tool module.
+"""
+import ast
+from pathlib import Path
+
+TOOLS_DIR = Path("src/tools")
+OUTPUT_FILE = TOOLS_DIR / "_manifest.py"
+PACKAGE = "src.tools"
+
+def is_generator(func: ast.FunctionDef) -> bool:
+    """True if the function body itself yields (nested scopes don't count)"""
+    stack = list(func.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Yield, ast.YieldFrom)):
+            return True
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            stack.extend(ast.iter_child_nodes(node))
+    return False
+
+def public_functions(module_path: Path):
+    """Return names of public top-level functions defined in a module"""
+    tree = ast.parse(module_path.read_text(encoding="utf-8"), filename=str(module_path))
+    return sorted(
+        node.name
+        for node in tree.body
+        # Coroutine and generator functions are helpers, not agent tools
+        if isinstance(node, ast.FunctionDef)
+        and not node.name.startswith("_")
+        and not is_generator(node)
+    )
+
+def main():
+    modules = sorted(p for p in TOOLS_DIR.glob("*.py") if not p.name.startswith("_"))
+
+    lines = [
+        '"""Generated by scripts/build_tool_manifest.py - do not edit by hand."""',
+        "",
+        "MODULES = (",
+        *[f'    "{path.stem}",' for path in modules],
+        ")",
+        "",
+        "# [name, mtime_ns, size] per module, as src.tools._module_fingerprint reports",
+        "FINGERPRINT = [",
+        *[f'    ["{path.stem}", {path.stat().st_mtime_ns}, {path.stat().st_size}],' for path in modules],
+        "]",
+        "",
+        "TOOLS = {",
+    ]
+    count = 0
+    for path in modules:
+        for name in public_functions(path):
+            lines.append(f'    "{name}": ("{PACKAGE}.{path.stem}", "{name}"),')
+            count += 1
+    lines.append("}")
+
+    OUTPUT_FILE.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"✓ Generated {OUTPUT_FILE}")
+    print(f"  - {len(modules)} modules")
+    print(f"  - {count} tools")
+
+if __name__ == "__main__":
+    main()
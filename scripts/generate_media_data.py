@@ -1,41 +1,53 @@
 """
 Generate media-data.js from optimized files
 """
+import json
+import os
 from pathlib import Path
-import re
 
 OPTIMIZED_DIR = Path("assets/media/optimized")
 THUMB_DIR = Path("assets/media/thumbnails")
 OUTPUT_FILE = Path("js/media-data.js")
 
+DEFAULT_DATE = "2023-01-01"
+
 def extract_date(filename):
     """Extract date from filename like 2024-03-04_05-16-17_UTC_1.webp"""
-    match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-    return match.group(1) if match else "2023-01-01"
+    date = filename[:10]
+    if len(date) == 10 and date[4] == '-' and date[7] == '-' and date[:4].isdigit():
+        return date
+    return DEFAULT_DATE
 
 def main():
     images = []
     videos = []
     profile_pic = None
     
-    for file in sorted(OPTIMIZED_DIR.iterdir()):
-        if 'profile_pic' in file.name:
-            profile_pic = f"assets/media/optimized/{file.name}"
+    # One directory read instead of an exists() stat per video
+    thumb_set = set(os.listdir(THUMB_DIR)) if THUMB_DIR.exists() else set()
+    
+    # Single directory pass; DirEntry names avoid building a Path per file
+    entries = list(os.scandir(OPTIMIZED_DIR))
+    entries.sort(key=lambda e: e.name)
+    
+    for entry in entries:
+        name = entry.name
+        if 'profile_pic' in name:
+            profile_pic = f"assets/media/optimized/{name}"
             continue
             
-        date = extract_date(file.name)
+        date = extract_date(name)
         
-        if file.suffix == '.webp':
+        if name.endswith('.webp'):
             images.append({
-                "src": f"assets/media/optimized/{file.name}",
+                "src": f"assets/media/optimized/{name}",
                 "date": date
             })
-        elif file.suffix == '.mp4':
-            poster_name = f"{file.stem}_poster.jpg"
-            poster_path = THUMB_DIR / poster_name
-            poster = f"assets/media/thumbnails/{poster_name}" if poster_path.exists() else None
+        elif name.endswith('.mp4'):
+            poster_name = f"{name[:-4]}_poster.jpg"
+            poster = f"assets/media/thumbnails/{poster_name}" if poster_name in thumb_set else None
             videos.append({
-                "src": f"assets/media/optimized/{file.name}",
+                "src": f"assets/media/optimized/{name}",
                 "date": date,
                 "poster": poster
             })
@@ -44,39 +56,28 @@ def main():
     images.sort(key=lambda x: x['date'], reverse=True)
     videos.sort(key=lambda x: x['date'], reverse=True)
     
-    # Generate JS
+    media = {
+        "profile": {
+            "username": "anhkhoiii_090",
+            "profilePic": profile_pic or "assets/media/optimized/profile_pic.webp"
+        },
+        "images": images,
+        "videos": videos
+    }
+    
+    # Generate JS - json.dumps handles escaping (e.g. quotes in filenames)
     js_content = f'''// Media Data - Generated from Instagram @anhkhoiii_090
 // Optimized: {len(images)} images (WebP) + {len(videos)} videos (Compressed MP4)
 
-const MEDIA_DATA = {{
-  profile: {{
-    username: 'anhkhoiii_090',
-    profilePic: '{profile_pic or "assets/media/optimized/profile_pic.webp"}'
-  }},
-  
-  images: [
-'''
-    
-    for img in images:
-        js_content += f"    {{ src: '{img['src']}', date: '{img['date']}' }},\n"
-    
-    js_content = js_content.rstrip(',\n') + '\n  ],\n\n  videos: [\n'
-    
-    for vid in videos:
-        poster_str = f"'{vid['poster']}'" if vid['poster'] else 'null'
-        js_content += f"    {{ src: '{vid['src']}', date: '{vid['date']}', poster: {poster_str} }},\n"
-    
-    js_content = js_content.rstrip(',\n') + '''
-  ]
-};
+const MEDIA_DATA = {json.dumps(media, indent=2, ensure_ascii=False)};
 
 // Combine all media sorted by date (newest first)
 const ALL_MEDIA = [
-  ...MEDIA_DATA.images.map(img => ({ ...img, type: 'image' })),
-  ...MEDIA_DATA.videos.map(vid => ({ ...vid, type: 'video' }))
+  ...MEDIA_DATA.images.map(img => ({{ ...img, type: 'image' }})),
+  ...MEDIA_DATA.videos.map(vid => ({{ ...vid, type: 'video' }}))
 ].sort((a, b) => new Date(b.date) - new Date(a.date));
 
-export { MEDIA_DATA, ALL_MEDIA };
+export {{ MEDIA_DATA, ALL_MEDIA }};
 '''
     
     OUTPUT_FILE.write_text(js_content, encoding='utf-8')
@@ -5,8 +5,13 @@ Uses FFmpeg and ImageMagick from media-processing skill
 """
 
 import os
+import argparse
 import subprocess
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 import json
 
@@ -25,8 +30,33 @@ MAX_IMAGE_WIDTH = 1200
 
 # Video settings - H.264 compression
 VIDEO_CRF = 28  # Higher = smaller file, lower quality (18-28 recommended)
-VIDEO_PRESET = "medium"  # ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow
+VIDEO_PRESET = "faster"  # ultrafast, superfast, veryfast, faster, fast, medium, slow, slower, veryslow
+VIDEO_TUNE = "film"  # film, animation, grain, stillimage, fastdecode, zerolatency
+VIDEO_PROFILE = "high"  # H.264 profile understood by all current browsers/iOS
+VIDEO_LEVEL = "4.1"
 VIDEO_MAX_HEIGHT = 720
+VIDEO_VT_QUALITY = 60  # VideoToolbox has no CRF; 0-100, higher = better
+VIDEO_THREADS = 2  # Threads per ffmpeg process; parallelism comes from running several at once
+
+# Archival mode - two-pass libx264 at a target average bitrate picked by output height
+ARCHIVAL_BITRATES = [(480, "1200k"), (720, "2500k"), (1080, "5000k"), (1440, "8000k")]
+
+# Hardware H.264 encoders, in order of preference. libx264 is the fallback.
+HW_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_amf", "h264_videotoolbox"]
+
+# Encoders whose -profile:v / -level options take the values above
+PROFILE_ENCODERS = {"libx264", "h264_nvenc", "h264_amf", "h264_videotoolbox"}
+LEVEL_ENCODERS = {"libx264", "h264_nvenc", "h264_amf"}
+
+# Parallelism - the Python side only waits on magick/ffmpeg, so threads are enough
+DEFAULT_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+_print_lock = threading.Lock()
+
+def log(message: str):
+    """Print a line without interleaving output from worker threads"""
+    with _print_lock:
+        print(message)
 
 def ensure_dirs():
     """Create output directories"""
@@ -34,6 +64,58 @@ def ensure_dirs():
     THUMB_DIR.mkdir(parents=True, exist_ok=True)
     print(f"✓ Created output directories")
 
+def probe_video_encoder(encoder: str):
+    """Check that an encoder really works here by encoding one blank frame"""
+    # -encoders lists what the build includes, not which GPU is present
+    cmd = [
+        FFMPEG_PATH, "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", "nullsrc=s=256x256",
+        "-frames:v", "1",
+        *video_codec_args(encoder, VIDEO_PRESET, VIDEO_CRF),
+        "-f", "null", "-"
+    ]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+def detect_video_encoder():
+    """Pick the best H.264 encoder this ffmpeg build supports and this machine can run"""
+    try:
+        result = subprocess.run(
+            [FFMPEG_PATH, "-hide_banner", "-encoders"],
+            check=True, capture_output=True, text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "libx264"
+
+    available = {line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1}
+    for encoder in HW_ENCODERS:
+        if encoder in available and probe_video_encoder(encoder):
+            return encoder
+    return "libx264"
+
+def video_codec_args(encoder: str, preset: str, crf: int):
+    """Build encoder-specific rate control arguments"""
+    if encoder == "h264_nvenc":
+        quality = ["-rc", "vbr", "-cq", str(crf), "-b:v", "0"]
+    elif encoder == "h264_qsv":
+        quality = ["-global_quality", str(crf)]
+    elif encoder == "h264_amf":
+        quality = ["-rc", "cqp", "-qp_i", str(crf), "-qp_p", str(crf)]
+    elif encoder == "h264_videotoolbox":
+        quality = ["-q:v", str(VIDEO_VT_QUALITY)]
+    else:
+        # -preset/-tune values are libx264-specific
+        quality = ["-preset", preset, "-tune", VIDEO_TUNE, "-crf", str(crf)]
+    args = ["-c:v", encoder, *quality]
+    if encoder in PROFILE_ENCODERS:
+        args += ["-profile:v", VIDEO_PROFILE]
+    if encoder in LEVEL_ENCODERS:
+        args += ["-level", VIDEO_LEVEL]
+    return args
+
 def optimize_image(src_path: Path, dest_path: Path):
     """Convert image to WebP format with compression"""
     webp_path = dest_path.with_suffix('.webp')
@@ -52,78 +134,229 @@ def optimize_image(src_path: Path, dest_path: Path):
         original_size = src_path.stat().st_size
         new_size = webp_path.stat().st_size
         reduction = (1 - new_size / original_size) * 100
-        print(f"  ✓ {src_path.name} → {webp_path.name} ({reduction:.1f}% smaller)")
+        log(f"  ✓ {src_path.name} → {webp_path.name} ({reduction:.1f}% smaller)")
         return webp_path
     except subprocess.CalledProcessError as e:
-        print(f"  ✗ Failed: {src_path.name} - {e}")
+        log(f"  ✗ Failed: {src_path.name} - {e}")
         return None
 
-def optimize_video(src_path: Path, dest_path: Path):
+def optimize_image_batch(src_paths: list):
+    """Convert a batch of images to WebP with a single mogrify process"""
+    if not src_paths:
+        return []
+
+    # One process for the whole batch avoids per-file magick startup cost
+    cmd = [
+        MAGICK_PATH, "mogrify",
+        "-format", "webp",
+        "-path", str(OUTPUT_DIR),
+        "-resize", f"{MAX_IMAGE_WIDTH}x>",  # Resize only if larger
+        "-quality", str(IMAGE_QUALITY),
+        "-strip",  # Remove metadata
+        *map(str, src_paths)
+    ]
+    
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        # One bad file fails the whole batch; redo it file by file so the rest still convert
+        log(f"  ⚠ Batch of {len(src_paths)} images failed ({e}), retrying one by one")
+        results = (optimize_image(src_path, OUTPUT_DIR / src_path.name) for src_path in src_paths)
+        return [webp_path for webp_path in results if webp_path]
+
+    results = []
+    for src_path in src_paths:
+        webp_path = OUTPUT_DIR / f"{src_path.stem}.webp"
+        if not webp_path.exists():
+            log(f"  ✗ Failed: {src_path.name} - no output written")
+            continue
+        reduction = (1 - webp_path.stat().st_size / src_path.stat().st_size) * 100
+        log(f"  ✓ {src_path.name} → {webp_path.name} ({reduction:.1f}% smaller)")
+        results.append(webp_path)
+    return results
+
+def optimize_video(src_path: Path, dest_path: Path, preset: str = VIDEO_PRESET, crf: int = VIDEO_CRF,
+                   encoder: str = "libx264"):
     """Compress video with H.264 and create poster"""
     mp4_path = dest_path.with_suffix('.mp4')
     poster_path = THUMB_DIR / f"{src_path.stem}_poster.jpg"
     
-    # Compress video
+    # Compress video and grab the poster in one pass so the source is decoded once
     cmd = [
         FFMPEG_PATH, "-y",
         "-i", str(src_path),
-        "-c:v", "libx264",
-        "-preset", VIDEO_PRESET,
-        "-crf", str(VIDEO_CRF),
+        # Output 1: compressed MP4
+        "-map", "0:v:0",
+        "-map", "0:a:0?",  # Audio is optional (some clips are silent)
+        *video_codec_args(encoder, preset, crf),
+        "-threads", str(VIDEO_THREADS),
         "-vf", f"scale=-2:{VIDEO_MAX_HEIGHT}",  # 720p
         "-c:a", "aac",
         "-b:a", "128k",
         "-movflags", "+faststart",  # Fast web playback
-        str(mp4_path)
+        str(mp4_path),
+        # Output 2: poster/thumbnail
+        "-map", "0:v:0",
+        "-ss", "00:00:01",  # 1 second in
+        "-vframes", "1",
+        "-vf", f"scale={MAX_IMAGE_WIDTH}:-1",
+        "-q:v", "2",
+        str(poster_path)
     ]
     
     try:
         subprocess.run(cmd, check=True, capture_output=True)
         
-        # Generate poster/thumbnail
-        poster_cmd = [
+        original_size = src_path.stat().st_size
+        new_size = mp4_path.stat().st_size
+        reduction = (1 - new_size / original_size) * 100
+        log(f"  ✓ {src_path.name} → {mp4_path.name} ({reduction:.1f}% smaller)")
+        return mp4_path, poster_path
+    except subprocess.CalledProcessError as e:
+        if encoder != "libx264":
+            # Hardware encoders can still fail on some inputs (size limits, busy GPU)
+            log(f"  ⚠ {encoder} failed on {src_path.name}, retrying with libx264")
+            return optimize_video(src_path, dest_path, preset=preset, crf=crf, encoder="libx264")
+        log(f"  ✗ Failed: {src_path.name} - {e}")
+        return None, None
+
+def archival_bitrate(height: int):
+    """Target video bitrate for two-pass encoding at the given output height"""
+    for max_height, bitrate in ARCHIVAL_BITRATES:
+        if height <= max_height:
+            return bitrate
+    return ARCHIVAL_BITRATES[-1][1]
+
+def optimize_video_two_pass(src_path: Path, dest_path: Path, preset: str = VIDEO_PRESET,
+                            bitrate: str = archival_bitrate(VIDEO_MAX_HEIGHT)):
+    """Compress video with two-pass libx264 at a target bitrate and create poster"""
+    mp4_path = dest_path.with_suffix('.mp4')
+    poster_path = THUMB_DIR / f"{src_path.stem}_poster.jpg"
+    
+    video_args = [
+        "-c:v", "libx264",
+        "-preset", preset,
+        "-tune", VIDEO_TUNE,
+        "-profile:v", VIDEO_PROFILE,
+        "-level", VIDEO_LEVEL,
+        "-b:v", bitrate,
+        "-threads", str(VIDEO_THREADS),
+        "-vf", f"scale=-2:{VIDEO_MAX_HEIGHT}",  # 720p
+    ]
+    
+    # Each video gets its own pass log so parallel encodes don't collide
+    with tempfile.TemporaryDirectory(prefix="x264_2pass_") as tmpdir:
+        passlog = os.path.join(tmpdir, "ffmpeg2pass")
+        
+        # Pass 1: analysis only, no output file
+        first_pass = [
+            FFMPEG_PATH, "-y",
+            "-i", str(src_path),
+            "-map", "0:v:0",
+            *video_args,
+            "-pass", "1",
+            "-passlogfile", passlog,
+            "-an",
+            "-f", "null", os.devnull
+        ]
+        
+        # Pass 2: final encode plus poster from the same decode
+        second_pass = [
             FFMPEG_PATH, "-y",
             "-i", str(src_path),
-            "-ss", "00:00:01",  # 1 second in
+            "-map", "0:v:0",
+            "-map", "0:a:0?",
+            *video_args,
+            "-pass", "2",
+            "-passlogfile", passlog,
+            "-c:a", "aac",
+            "-b:a", "128k",
+            "-movflags", "+faststart",
+            str(mp4_path),
+            "-map", "0:v:0",
+            "-ss", "00:00:01",
             "-vframes", "1",
             "-vf", f"scale={MAX_IMAGE_WIDTH}:-1",
             "-q:v", "2",
             str(poster_path)
         ]
-        subprocess.run(poster_cmd, check=True, capture_output=True)
         
-        original_size = src_path.stat().st_size
-        new_size = mp4_path.stat().st_size
-        reduction = (1 - new_size / original_size) * 100
-        print(f"  ✓ {src_path.name} → {mp4_path.name} ({reduction:.1f}% smaller)")
-        return mp4_path, poster_path
-    except subprocess.CalledProcessError as e:
-        print(f"  ✗ Failed: {src_path.name} - {e}")
-        return None, None
+        try:
+            subprocess.run(first_pass, check=True, capture_output=True)
+            subprocess.run(second_pass, check=True, capture_output=True)
+        except subprocess.CalledProcessError as e:
+            log(f"  ✗ Failed: {src_path.name} - {e}")
+            return None, None
+    
+    original_size = src_path.stat().st_size
+    new_size = mp4_path.stat().st_size
+    reduction = (1 - new_size / original_size) * 100
+    log(f"  ✓ {src_path.name} → {mp4_path.name} ({reduction:.1f}% smaller, 2-pass {bitrate})")
+    return mp4_path, poster_path
 
 def generate_media_data():
     """Generate updated media-data.js with optimized paths"""
     images = []
     videos = []
     
+    # Snapshot directory listings once instead of stat-ing each file
+    thumb_set = set(os.listdir(THUMB_DIR)) if THUMB_DIR.exists() else set()
+    output_names = os.listdir(OUTPUT_DIR) if OUTPUT_DIR.exists() else []
+    
     # Scan optimized directory
-    for file in OUTPUT_DIR.iterdir():
-        if file.suffix == '.webp':
+    for name in output_names:
+        if name.endswith('.webp'):
             images.append({
-                "src": f"assets/media/optimized/{file.name}",
+                "src": f"assets/media/optimized/{name}",
                 "type": "image"
             })
-        elif file.suffix == '.mp4':
-            poster = THUMB_DIR / f"{file.stem}_poster.jpg"
+        elif name.endswith('.mp4'):
+            poster_name = f"{name[:-4]}_poster.jpg"
             videos.append({
-                "src": f"assets/media/optimized/{file.name}",
-                "poster": f"assets/media/thumbnails/{poster.name}" if poster.exists() else None,
+                "src": f"assets/media/optimized/{name}",
+                "poster": f"assets/media/thumbnails/{poster_name}" if poster_name in thumb_set else None,
                 "type": "video"
             })
     
     return images, videos
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Optimize Instagram media for the web")
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of files to process in parallel (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--preset",
+        default=VIDEO_PRESET,
+        help=f"x264 preset, e.g. slow for archival runs (default: {VIDEO_PRESET})",
+    )
+    parser.add_argument(
+        "--crf",
+        type=int,
+        default=VIDEO_CRF,
+        help=f"x264 constant rate factor (default: {VIDEO_CRF})",
+    )
+    parser.add_argument(
+        "--encoder",
+        default="auto",
+        help="H.264 encoder to use, e.g. libx264 or h264_nvenc (default: auto-detect)",
+    )
+    parser.add_argument(
+        "--quality",
+        choices=["fast", "archival"],
+        default="fast",
+        help="fast: single-pass CRF; archival: two-pass libx264 at a target bitrate (default: fast)",
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    jobs = max(1, args.jobs)
+
     print("=" * 60)
     print("MEDIA OPTIMIZATION SCRIPT")
     print("=" * 60)
@@ -138,19 +371,29 @@ def main():
     
     # Calculate original size
     original_size = sum(f.stat().st_size for f in images + videos)
-    print(f"Original total size: {original_size / 1024 / 1024:.2f} MB\n")
-    
-    # Process images
-    print("OPTIMIZING IMAGES (JPG → WebP)...")
-    for img in images:
-        dest = OUTPUT_DIR / img.name
-        optimize_image(img, dest)
-    
-    # Process videos
-    print("\nOPTIMIZING VIDEOS (MP4 compression)...")
-    for vid in videos:
-        dest = OUTPUT_DIR / vid.name
-        optimize_video(vid, dest)
+    print(f"Original total size: {original_size / 1024 / 1024:.2f} MB")
+    if args.quality == "archival":
+        # Two-pass rate control is only wired up for libx264
+        encoder = "libx264"
+    else:
+        encoder = detect_video_encoder() if args.encoder == "auto" else args.encoder
+    print(f"Parallel jobs: {jobs}")
+    print(f"Video encoder: {encoder} ({args.quality})\n")
+    
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Process images - shard into one mogrify batch per worker
+        print("OPTIMIZING IMAGES (JPG → WebP)...")
+        batches = [images[i::jobs] for i in range(jobs) if images[i::jobs]]
+        list(executor.map(optimize_image_batch, batches))
+        
+        # Process videos
+        log("\nOPTIMIZING VIDEOS (MP4 compression)...")
+        if args.quality == "archival":
+            encode = partial(optimize_video_two_pass, preset=args.preset,
+                             bitrate=archival_bitrate(VIDEO_MAX_HEIGHT))
+        else:
+            encode = partial(optimize_video, preset=args.preset, crf=args.crf, encoder=encoder)
+        list(executor.map(encode, videos, [OUTPUT_DIR / vid.name for vid in videos]))
     
     # Calculate new size
     optimized_files = list(OUTPUT_DIR.iterdir())
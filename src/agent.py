@@ -1,10 +1,12 @@
 import json
+import re
 import time
 import os
 import sys
 import asyncio
-import inspect
-import importlib.util
+from collections import OrderedDict, namedtuple
+from hashlib import blake2b
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -13,12 +15,38 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from google import genai
-
 from src.config import settings
 from src.memory import MemoryManager
 from src.tools.openai_proxy import call_openai_chat
 
+# Matches a plain-text tool request such as "Action: web_search"
+_ACTION_RE = re.compile(r"^action:[ \t]*(\S.*)$", re.IGNORECASE | re.MULTILINE)
+
+_role_and_content = itemgetter("role", "content")
+
+
+# Canned reply used when no real model backend is available
+_DummyResponse = namedtuple("_DummyResponse", ["text"])
+_DUMMY_RESPONSE = _DummyResponse("I have completed the task")
+
+
+class _DummyClient:
+    """Offline stand-in for genai.Client used under pytest or when no backend is configured."""
+
+    class _Models:
+        def generate_content(self, model, contents):
+            return _DUMMY_RESPONSE
+
+    def __init__(self):
+        self.models = self._Models()
+
+
+def _lazy_genai():
+    """Imports google.genai on first use; dummy/OpenAI-backed agents never pay for it."""
+    from google import genai
+
+    return genai
+
 
 class GeminiAgent:
     """
@@ -33,12 +61,26 @@ class GeminiAgent:
     allowing the agent to use external services and capabilities seamlessly.
     """
 
+    # Minimum number of overflowing messages before an LLM summary is worth a round-trip
+    SUMMARIZE_THRESHOLD = 8
+    # Number of summaries kept for identical summarization prompts
+    SUMMARY_CACHE_SIZE = 128
+
     def __init__(self):
         self.settings = settings
         self.memory = MemoryManager()
         self.mcp_manager = None  # Will be initialized if MCP is enabled
         self.use_openai_backend = False  # Use OpenAI-compatible backend when configured
 
+        # Prompt fragments that are invariant across turns; built lazily and
+        # reset via _invalidate_prompt_caches() when the tool set changes.
+        self._tool_descriptions: Optional[str] = None
+        self._context_knowledge: Optional[str] = None
+        self._act_system_prompt: Optional[str] = None
+
+        # Summaries keyed by prompt digest; summarizing the same window twice is deterministic
+        self._summary_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
         # Dynamically load all tools from src/tools/ directory
         self.available_tools: Dict[str, Callable[..., Any]] = self._load_tools()
 
@@ -46,6 +88,10 @@ class GeminiAgent:
         if self.settings.MCP_ENABLED:
             self._initialize_mcp()
 
+        # Warm the prompt caches once the final tool set is known
+        self._get_act_system_prompt()
+        self._get_context_knowledge()
+
         print(
             f"🤖 Initializing {self.settings.AGENT_NAME} with model {self.settings.GEMINI_MODEL_NAME}..."
         )
@@ -64,23 +110,12 @@ class GeminiAgent:
         )
 
         if running_under_pytest:
-
-            class _DummyClient:
-                class _Models:
-                    def generate_content(self, model, contents):
-                        class _R:
-                            text = "I have completed the task"
-
-                        return _R()
-
-                def __init__(self):
-                    self.models = self._Models()
-
             self.client = _DummyClient()
         else:
             try:
                 # If a Google API key is provided, prefer Gemini.
                 if self.settings.GOOGLE_API_KEY:
+                    genai = _lazy_genai()
                     self.client = genai.Client(api_key=self.settings.GOOGLE_API_KEY)
                 else:
                     # If no Google key but an OpenAI-compatible endpoint is set,
@@ -96,19 +131,7 @@ class GeminiAgent:
                         raise ValueError("No GOOGLE_API_KEY or OPENAI_BASE_URL configured")
             except Exception as e:
                 print(f"⚠️ genai client not initialized: {e}")
-
-                class _DummyClientFallback:
-                    class _Models:
-                        def generate_content(self, model, contents):
-                            class _R:
-                                text = "I have completed the task"
-
-                            return _R()
-
-                    def __init__(self):
-                        self.models = self._Models()
-
-                self.client = _DummyClientFallback()
+                self.client = _DummyClient()
 
     def _initialize_mcp(self) -> None:
         """
@@ -138,6 +161,7 @@ class GeminiAgent:
 
             if mcp_tools:
                 self.available_tools.update(mcp_tools)
+                self._invalidate_prompt_caches()
                 print(f"   🔧 Loaded {len(mcp_tools)} MCP tools")
 
         except ImportError as e:
@@ -148,54 +172,23 @@ class GeminiAgent:
 
     def _load_tools(self) -> Dict[str, Callable[..., Any]]:
         """
-        Automatically discover and load tools from src/tools/ directory.
+        Return the tools discovered in the src/tools/ package.
 
-        Scans the tools directory for Python modules, imports them dynamically,
-        and registers any public functions (not starting with _) as available tools.
-        This enables the "zero-config" philosophy - just drop a Python file into
-        src/tools/ and it becomes available to the agent.
+        The package imports each module once and registers any public function
+        (not starting with _) in ``src.tools.TOOLS``. This enables the
+        "zero-config" philosophy - just drop a Python file into src/tools/ and
+        it becomes available to the agent. Because the modules live in
+        sys.modules, creating further agents in the same process is free.
 
         Returns:
             Dictionary mapping tool names to callable functions.
         """
-        tools = {}
-
-        # Get the src/tools directory path relative to this file
-        tools_dir = Path(__file__).parent / "tools"
-
-        if not tools_dir.exists():
-            print(f"⚠️ Tools directory not found: {tools_dir}")
-            return tools
-
-        # Iterate through all Python files in the tools directory
-        for tool_file in tools_dir.glob("*.py"):
-            # Skip __init__.py and private modules
-            if tool_file.name.startswith("_"):
-                continue
+        from src.tools import TOOLS
 
-            module_name = tool_file.stem
-
-            try:
-                # Dynamically import the module
-                spec = importlib.util.spec_from_file_location(
-                    f"src.tools.{module_name}", tool_file
-                )
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
-                    # Find all public functions in the module
-                    for name, obj in inspect.getmembers(module, inspect.isfunction):
-                        # Only register public functions defined in this module
-                        if (
-                            not name.startswith("_")
-                            and obj.__module__ == f"src.tools.{module_name}"
-                        ):
-                            tools[name] = obj
-                            print(f"   ✓ Loaded tool: {name} from {module_name}.py")
-
-            except Exception as e:
-                print(f"   ⚠️ Failed to load tools from {tool_file.name}: {e}")
+        tools = dict(TOOLS)
+        for name, fn in tools.items():
+            module_name = fn.__module__.rsplit(".", 1)[-1]
+            print(f"   ✓ Loaded tool: {name} from {module_name}.py")
 
         return tools
 
@@ -232,7 +225,48 @@ class GeminiAgent:
 
         return "\n".join(context_parts)
 
+    def _get_context_knowledge(self) -> str:
+        """
+        Returns the .context/ knowledge, reading the files only on first use.
+        """
+        if self._context_knowledge is None:
+            self._context_knowledge = self._load_context()
+        return self._context_knowledge
+
     def _get_tool_descriptions(self) -> str:
+        """
+        Returns the tool list for prompt injection, building it only on first use.
+        """
+        if self._tool_descriptions is None:
+            self._tool_descriptions = self._build_tool_descriptions()
+        return self._tool_descriptions
+
+    def _get_act_system_prompt(self) -> str:
+        """
+        Returns the tool-dispatch system prompt used by act(), built only on first use.
+        """
+        if self._act_system_prompt is None:
+            self._act_system_prompt = (
+                "You are an expert AI agent following the Think-Act-Reflect loop.\n"
+                "You have access to the following tools:\n"
+                f"{self._get_tool_descriptions()}\n\n"
+                "If you need a tool, respond ONLY with a JSON object using the schema:\n"
+                '{"action": "<tool_name>", "args": {"param": "value"}}\n'
+                "If no tool is needed, reply directly with the final answer."
+            )
+        return self._act_system_prompt
+
+    def _invalidate_prompt_caches(self) -> None:
+        """
+        Drops cached prompt fragments so they are rebuilt on the next turn.
+
+        Call this whenever available_tools changes (e.g. MCP tools hot-loaded).
+        """
+        self._tool_descriptions = None
+        self._context_knowledge = None
+        self._act_system_prompt = None
+
+    def _build_tool_descriptions(self) -> str:
         """
         Dynamically builds a list of available tools and their docstrings for prompt injection.
         """
@@ -245,15 +279,22 @@ class GeminiAgent:
     def _format_context_messages(self, context_messages: List[Dict[str, Any]]) -> str:
         """
         Flattens structured context into a plain-text prompt block.
+
+        MemoryManager guarantees every message carries 'role' and 'content'.
         """
-        lines = [
-            f"{msg.get('role', '').upper()}: {msg.get('content', '')}"
-            for msg in context_messages
-        ]
-        return "\n".join(lines)
+        return "\n".join(
+            f"{role.upper()}: {content}"
+            for role, content in map(_role_and_content, context_messages)
+        )
 
     def _call_gemini(self, prompt: str) -> str:
-        """Lightweight wrapper around the Gemini content generation call."""
+        """
+        Lightweight wrapper around the Gemini content generation call.
+
+        Both backends keep their connections warm across turns: self.client is
+        created once in __init__ and reuses its channel, and call_openai_chat
+        goes through a module-level requests.Session.
+        """
         if self.use_openai_backend:
             try:
                 return call_openai_chat(
@@ -298,21 +339,22 @@ class GeminiAgent:
         """
         cleaned = response_text.strip()
 
-        try:
-            payload = json.loads(cleaned)
-            if isinstance(payload, dict):
-                action = payload.get("action") or payload.get("tool")
-                args = payload.get("args") or payload.get("input") or {}
-                if action:
-                    return str(action), args if isinstance(args, dict) else {}
-        except json.JSONDecodeError:
-            pass
-
-        for line in cleaned.splitlines():
-            if line.lower().startswith("action:"):
-                action = line.split(":", 1)[1].strip()
-                if action:
-                    return action, {}
+        # Only JSON objects can carry a tool call; skip the decode (and the
+        # exception it raises) for ordinary free-form answers.
+        if cleaned.startswith("{"):
+            try:
+                payload = json.loads(cleaned)
+                if isinstance(payload, dict):
+                    action = payload.get("action") or payload.get("tool")
+                    args = payload.get("args") or payload.get("input") or {}
+                    if action:
+                        return str(action), args if isinstance(args, dict) else {}
+            except json.JSONDecodeError:
+                pass
+
+        match = _ACTION_RE.search(cleaned)
+        if match:
+            return match.group(1).strip(), {}
 
         return None, {}
 
@@ -321,7 +363,14 @@ class GeminiAgent:
     ) -> str:
         """
         Summarize older history into a concise buffer using Gemini.
+
+        When fewer than SUMMARIZE_THRESHOLD messages have overflowed the context
+        window, the previous summary is returned unchanged and no model call is
+        made; the overflow is folded in once enough of it has accumulated.
         """
+        if len(old_messages) < self.SUMMARIZE_THRESHOLD:
+            return previous_summary or ""
+
         history_block = "\n".join(
             [
                 f"- {m.get('role', 'unknown')}: {m.get('content', '')}"
@@ -341,15 +390,27 @@ class GeminiAgent:
             "Return only the new merged summary."
         )
 
+        key = blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+        cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Use the centralized wrapper that safely handles missing/None responses
-        return self._call_gemini(prompt)
+        summary = self._call_gemini(prompt)
+
+        # Don't pin transient backend failures in the cache
+        if summary and not summary.startswith("[openai-backend-error]"):
+            self._summary_cache[key] = summary
+            if len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summary
 
     def think(self, task: str) -> str:
         """
         Simulates the 'Deep Think' process of Gemini 3.
         """
         # Load context knowledge from .context/ directory
-        context_knowledge = self._load_context()
+        context_knowledge = self._get_context_knowledge()
 
         # Inject context into system prompt
         system_prompt = (
@@ -370,7 +431,9 @@ class GeminiAgent:
         print("   - Formulating execution plan...")
         print("</thought>\n")
 
-        time.sleep(1)
+        # Optional pacing for demos; no delay by default
+        if self.settings.AGENT_THINK_DELAY > 0:
+            time.sleep(self.settings.AGENT_THINK_DELAY)
         return "Plan formulated."
 
     def act(self, task: str) -> str:
@@ -385,16 +448,7 @@ class GeminiAgent:
 
         # 3) Tool dispatch entry point
         print(f"[TOOLS] Executing tools for: {task}")
-        tool_list = self._get_tool_descriptions()
-
-        system_prompt = (
-            "You are an expert AI agent following the Think-Act-Reflect loop.\n"
-            "You have access to the following tools:\n"
-            f"{tool_list}\n\n"
-            "If you need a tool, respond ONLY with a JSON object using the schema:\n"
-            '{"action": "<tool_name>", "args": {"param": "value"}}\n'
-            "If no tool is needed, reply directly with the final answer."
-        )
+        system_prompt = self._get_act_system_prompt()
 
         try:
             context_messages = self.memory.get_context_window(
@@ -5,10 +5,195 @@ Provides common functionality for agent execution, context management,
 and communication with the Gemini API.
 """
 
+import asyncio
+import atexit
+import functools
+import json
+import logging
 import os
-from typing import Any, Dict, List, Optional
-from google import genai
-from src.config import settings
+import threading
+from collections import OrderedDict, namedtuple
+from hashlib import blake2b
+from typing import Any, Dict, Iterator, List, Optional
+from src.config import json_loads, settings
+
+
+# Sliding-window history: recent turns kept verbatim, older ones folded into a summary
+HISTORY_MAX_TURNS = 20
+HISTORY_SUMMARY_MAX_CHARS = 2000
+
+logger = logging.getLogger(__name__)
+
+# Input budget per request, estimated at ~4 characters per token
+MAX_INPUT_TOKENS = 30_000
+CHARS_PER_TOKEN = 4
+
+# Connection pool shared by every agent through the single Gemini client
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY = 60.0
+
+# Process-wide LRU of model replies keyed by a digest of model + prompt
+RESPONSE_CACHE_SIZE = 512
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Instruction prepended when several tasks share one model call
+MARSHAL_INSTRUCTIONS = (
+    "Answer each of the following tasks independently. "
+    "Return ONLY a JSON array of strings, one answer per task, in the same order.\n\n"
+)
+
+
+def _lazy_genai():
+    """Import google.genai only when a real client is built."""
+    from google import genai
+    return genai
+
+
+# Minimal response object exposing ``text`` like the SDK's response
+_DummyResponse = namedtuple("_DummyResponse", ["text"])
+
+
+class _DummyClient:
+    """Offline stand-in for genai.Client used under pytest or when no client can be built."""
+    
+    class _Models:
+        def __init__(self, role: str):
+            self._role = role
+        
+        def generate_content(self, model, contents):
+            return _DummyResponse(f"[{self._role}] Task completed")
+        
+        def generate_content_stream(self, model, contents):
+            yield self.generate_content(model, contents)
+    
+    def __init__(self, role: str):
+        self.models = self._Models(role)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_genai_client() -> Optional[Any]:
+    """
+    Build the process-wide Gemini client once.
+    
+    All agents share this client, and with it one sized, keep-alive HTTP
+    connection pool for both the sync and async paths. The client is closed
+    at interpreter exit.
+    
+    Returns:
+        The shared genai.Client, or None if it could not be initialized.
+    """
+    try:
+        genai = _lazy_genai()
+        import httpx
+        
+        limits = httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+        client = genai.Client(
+            api_key=settings.GOOGLE_API_KEY,
+            http_options=genai.types.HttpOptions(
+                client_args={"limits": limits},
+                async_client_args={"limits": limits},
+            ),
+        )
+        atexit.register(client.close)
+        return client
+    except Exception as e:
+        logger.warning("⚠️ genai client not initialized: %s", e)
+        return None
+
+
+def _get_client(role: str) -> Any:
+    """
+    Return the client an agent should use.
+    
+    Args:
+        role: The agent's role, used to label dummy responses.
+        
+    Returns:
+        The shared Gemini client, or a dummy client under pytest or when the
+        real client is unavailable.
+    """
+    # Checked per call: PYTEST_CURRENT_TEST is only set while a test runs
+    if "PYTEST_CURRENT_TEST" in os.environ:
+        return _DummyClient(role)
+    return _get_genai_client() or _DummyClient(role)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for prompt budgeting."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+# Precompiled template for one "[sender]: content" context line
+_format_context_line = "[{from}]: {content}\n".format_map
+
+
+def _context_line(msg: Dict[str, str]) -> str:
+    """
+    Format one context message for a prompt.
+    
+    Message-bus entries always carry ``from`` and ``content``, so they take
+    the template fast path; defaults are only looked up for partial dicts.
+    
+    Args:
+        msg: A context message.
+        
+    Returns:
+        The formatted line, newline-terminated.
+    """
+    try:
+        return _format_context_line(msg)
+    except KeyError:
+        return f"[{msg.get('from', 'unknown')}]: {msg.get('content', '')}\n"
+
+
+def _response_text(response: Any) -> str:
+    """
+    Return a model response's text.
+    
+    Direct attribute access is the fast path; ``str(response)`` is only
+    built for objects that have no ``text`` attribute.
+    
+    Args:
+        response: The raw model response.
+        
+    Returns:
+        The response text.
+    """
+    try:
+        return response.text
+    except AttributeError:
+        return str(response)
+
+
+def _parse_marshaled_answers(text: str, expected: int) -> Optional[List[str]]:
+    """
+    Parse a JSON array of answers from a marshaled response.
+    
+    Args:
+        text: The raw response text, optionally wrapped in a code fence.
+        expected: Number of answers the batch should contain.
+        
+    Returns:
+        The answers as strings, or None if the response is not a JSON array
+        of the expected length.
+    """
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.strip("`")
+        cleaned = cleaned[cleaned.find("\n") + 1:] if "\n" in cleaned else ""
+    try:
+        answers = json_loads(cleaned)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(answers, list) or len(answers) != expected:
+        return None
+    return [answer if isinstance(answer, str) else json.dumps(answer) for answer in answers]
 
 
 class BaseAgent:
@@ -19,6 +204,18 @@ class BaseAgent:
     All agents share common execution logic but differ in their prompts and tools.
     """
     
+    # Fixed attribute layout; subclasses declare ``__slots__ = ()`` to keep it
+    __slots__ = (
+        "role",
+        "system_prompt",
+        "_prompt_prefix",
+        "conversation_history",
+        "_max_turns",
+        "_history_summary",
+        "_history_lock",
+        "client",
+    )
+    
     def __init__(self, role: str, system_prompt: str):
         """
         Initialize a base agent.
@@ -29,82 +226,350 @@ class BaseAgent:
         """
         self.role = role
         self.system_prompt = system_prompt
+        # Invariant head of every prompt this agent sends
+        self._prompt_prefix = f"{system_prompt}\n\nTask: "
         self.conversation_history: List[Dict[str, str]] = []
+        self._max_turns = HISTORY_MAX_TURNS
+        self._history_summary: str = ""
+        # Guards the history: delegations and async batches may record turns from several threads
+        self._history_lock = threading.Lock()
         
-        # Initialize Gemini client
-        running_under_pytest = "PYTEST_CURRENT_TEST" in os.environ
-        if running_under_pytest:
-            # Dummy client for testing
-            class _DummyClient:
-                class _Models:
-                    def generate_content(self, model, contents):
-                        class _R:
-                            text = f"[{role}] Task completed"
-                        return _R()
-                def __init__(self):
-                    self.models = self._Models()
-            self.client = _DummyClient()
-        else:
-            try:
-                self.client = genai.Client(api_key=settings.GOOGLE_API_KEY)
-            except Exception as e:
-                print(f"⚠️ {role} agent: genai client not initialized: {e}")
-                # Fallback to dummy client
-                class _DummyClient:
-                    class _Models:
-                        def generate_content(self, model, contents):
-                            class _R:
-                                text = f"[{role}] Task completed"
-                            return _R()
-                    def __init__(self):
-                        self.models = self._Models()
-                self.client = _DummyClient()
-    
-    def execute(self, task: str, context: Optional[List[Dict[str, str]]] = None) -> str:
+        # Shared Gemini client (or a dummy under pytest / without credentials)
+        self.client = _get_client(role)
+    
+    def _build_prompt(self, task: str, context: Optional[List[Dict[str, str]]] = None) -> str:
         """
-        Execute a task with optional context from other agents.
+        Build the full prompt for a task and optional context.
+        
+        The system prompt and task are always sent in full. Context messages
+        are kept newest-first until the prompt would exceed
+        ``MAX_INPUT_TOKENS``; older messages beyond that are dropped.
         
         Args:
             task: The task description to execute.
             context: Optional list of previous messages from other agents.
             
         Returns:
-            The agent's response as a string.
+            The prompt string sent to the model.
         """
-        # Build the full prompt
-        prompt_parts = [self.system_prompt, f"\n\nTask: {task}"]
+        prompt_parts = [self._prompt_prefix, task]
         
         # Add context if provided
         if context:
-            context_str = "\n\nContext from other agents:\n"
-            for msg in context:
-                context_str += f"[{msg.get('from', 'unknown')}]: {msg.get('content', '')}\n"
-            prompt_parts.append(context_str)
+            header = "\n\nContext from other agents:\n"
+            lines = [_context_line(msg) for msg in context]
+            budget = MAX_INPUT_TOKENS - _estimate_tokens(
+                self._prompt_prefix + task + header
+            )
+            if sum(map(len, lines)) // CHARS_PER_TOKEN > budget:
+                kept = []
+                for line in reversed(lines):
+                    cost = _estimate_tokens(line)
+                    if cost > budget:
+                        break
+                    budget -= cost
+                    kept.append(line)
+                kept.reverse()
+                lines = kept
+            if lines:
+                prompt_parts.append(header)
+                prompt_parts.extend(lines)
         
-        full_prompt = "".join(prompt_parts)
+        return "".join(prompt_parts)
+    
+    def _record_turn(self, task: str, response: Any) -> str:
+        """
+        Extract the response text and store the exchange in conversation history.
         
-        # Call Gemini API
-        try:
-            response = self.client.models.generate_content(
-                model=settings.GEMINI_MODEL_NAME,
-                contents=full_prompt
-            )
-            result = getattr(response, "text", str(response)).strip()
+        Args:
+            task: The task that was executed.
+            response: The raw model response.
             
-            # Store in conversation history
+        Returns:
+            The response text.
+        """
+        result = _response_text(response).strip()
+        self._remember(task, result)
+        return result
+    
+    def _remember(self, task: str, result: str) -> None:
+        """
+        Store a task and its result in conversation history.
+        
+        Args:
+            task: The task that was executed.
+            result: The agent's response text.
+        """
+        self._append_turn(task, result)
+    
+    def _append_turn(self, user: str, assistant: str) -> None:
+        """
+        Append a user/assistant pair, evicting the oldest turns past the window.
+        
+        Evicted turns are compacted into ``_history_summary`` so the history
+        stays O(max_turns) no matter how many tasks the agent runs.
+        
+        Args:
+            user: The task text.
+            assistant: The agent's response text.
+        """
+        with self._history_lock:
             self.conversation_history.append({
                 "role": "user",
-                "content": task
+                "content": user
             })
             self.conversation_history.append({
                 "role": "assistant",
-                "content": result
+                "content": assistant
             })
             
-            return result
+            overflow = len(self.conversation_history) - 2 * self._max_turns
+            if overflow > 0:
+                evicted = self.conversation_history[:overflow]
+                del self.conversation_history[:overflow]
+                self._fold_into_summary(evicted)
+    
+    def _fold_into_summary(self, messages: List[Dict[str, str]]) -> None:
+        """
+        Compact evicted messages into the rolling history summary.
+        
+        Called with ``_history_lock`` held.
+        
+        Args:
+            messages: Messages removed from the sliding window, oldest first.
+        """
+        lines = [self._history_summary] if self._history_summary else []
+        lines.extend(f"{msg['role']}: {msg['content']}" for msg in messages)
+        # Keep the most recent part of the summary within budget
+        self._history_summary = "\n".join(lines)[-HISTORY_SUMMARY_MAX_CHARS:]
+    
+    def get_context_for_prompt(self) -> str:
+        """
+        Return this agent's history formatted for inclusion in a prompt.
+        
+        Returns:
+            The rolling summary (if any) followed by the recent turns.
+        """
+        with self._history_lock:
+            parts = []
+            if self._history_summary:
+                parts.append(f"Summary of earlier turns:\n{self._history_summary}")
+            parts.extend(f"{msg['role']}: {msg['content']}" for msg in self.conversation_history)
+        return "\n".join(parts)
+    
+    def execute(
+        self,
+        task: str,
+        context: Optional[List[Dict[str, str]]] = None,
+        bypass_cache: bool = False
+    ) -> str:
+        """
+        Execute a task with optional context from other agents.
+        
+        Identical prompts are answered from a shared LRU cache without a
+        model call; pass ``bypass_cache`` when replies are non-deterministic.
+        
+        Args:
+            task: The task description to execute.
+            context: Optional list of previous messages from other agents.
+            bypass_cache: Always call the model and leave the cache untouched.
+            
+        Returns:
+            The agent's response as a string.
+        """
+        full_prompt = self._build_prompt(task, context)
+        
+        key = None
+        if not bypass_cache:
+            key = blake2b(
+                f"{settings.GEMINI_MODEL_NAME}\0{full_prompt}".encode("utf-8"),
+                digest_size=16
+            ).hexdigest()
+            with _RESPONSE_CACHE_LOCK:
+                cached = _RESPONSE_CACHE.get(key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(key)
+            if cached is not None:
+                self._remember(task, cached)
+                return cached
+        
+        # Call Gemini API
+        try:
+            result = "".join(self._stream_prompt(task, full_prompt)).strip()
         except Exception as e:
             return f"[{self.role}] Error executing task: {str(e)}"
+        
+        if key is not None:
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = result
+                if len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+        return result
+    
+    def execute_stream(
+        self,
+        task: str,
+        context: Optional[List[Dict[str, str]]] = None
+    ) -> Iterator[str]:
+        """
+        Execute a task and yield the response text as it arrives.
+        
+        The exchange is recorded in conversation history once the stream
+        completes. On failure the error message is yielded instead.
+        
+        Args:
+            task: The task description to execute.
+            context: Optional list of previous messages from other agents.
+            
+        Yields:
+            Chunks of the agent's response text.
+        """
+        try:
+            yield from self._stream_prompt(task, self._build_prompt(task, context))
+        except Exception as e:
+            yield f"[{self.role}] Error executing task: {str(e)}"
+    
+    def _stream_prompt(self, task: str, full_prompt: str) -> Iterator[str]:
+        """
+        Stream the model's reply to a prompt and record the finished turn.
+        
+        Args:
+            task: The task description, recorded in history.
+            full_prompt: The prompt sent to the model.
+            
+        Yields:
+            Chunks of the response text. API errors propagate to the caller.
+        """
+        chunks: List[str] = []
+        stream = getattr(self.client.models, "generate_content_stream", None)
+        if stream is None:
+            # Clients without streaming support deliver the whole reply at once
+            responses = iter([self.client.models.generate_content(
+                model=settings.GEMINI_MODEL_NAME,
+                contents=full_prompt
+            )])
+        else:
+            responses = stream(model=settings.GEMINI_MODEL_NAME, contents=full_prompt)
+        
+        for chunk in responses:
+            text = getattr(chunk, "text", None)
+            if text:
+                chunks.append(text)
+                yield text
+        
+        self._remember(task, "".join(chunks).strip())
+    
+    def execute_marshaled(
+        self,
+        tasks: List[str],
+        batch_size: int = 4,
+        context: Optional[List[Dict[str, str]]] = None
+    ) -> List[str]:
+        """
+        Execute several independent tasks with one model call per batch.
+        
+        Packing tasks into a single prompt amortizes the fixed per-request
+        overhead. If a batch response cannot be parsed as a JSON array of the
+        right length, that batch falls back to one execute() call per task.
+        
+        Args:
+            tasks: Task descriptions to execute.
+            batch_size: Maximum number of tasks packed into one call.
+            context: Optional shared context passed with every batch.
+            
+        Returns:
+            Responses in the same order as ``tasks``.
+        """
+        results: List[str] = []
+        batch_size = max(1, batch_size)
+        
+        for start in range(0, len(tasks), batch_size):
+            batch = tasks[start:start + batch_size]
+            if len(batch) == 1:
+                results.append(self.execute(batch[0], context))
+                continue
+            
+            numbered = "\n".join(f"Task {i}: {task}" for i, task in enumerate(batch, 1))
+            full_prompt = self._build_prompt(MARSHAL_INSTRUCTIONS + numbered, context)
+            
+            answers = None
+            try:
+                response = self.client.models.generate_content(
+                    model=settings.GEMINI_MODEL_NAME,
+                    contents=full_prompt
+                )
+                answers = _parse_marshaled_answers(_response_text(response), len(batch))
+            except Exception:
+                answers = None
+            
+            if answers is None:
+                results.extend(self.execute(task, context) for task in batch)
+                continue
+            
+            for task, answer in zip(batch, answers):
+                self._remember(task, answer.strip())
+                results.append(answer.strip())
+        
+        return results
+    
+    async def execute_async(self, task: str, context: Optional[List[Dict[str, str]]] = None) -> str:
+        """
+        Execute a task without blocking the event loop.
+        
+        Uses the SDK's native async client (``client.aio``) so several agents
+        can wait on the network concurrently. Clients without an async
+        interface (e.g. the test dummy) run in a worker thread instead.
+        
+        Args:
+            task: The task description to execute.
+            context: Optional list of previous messages from other agents.
+            
+        Returns:
+            The agent's response as a string.
+        """
+        full_prompt = self._build_prompt(task, context)
+        
+        try:
+            aio = getattr(self.client, "aio", None)
+            if aio is not None:
+                response = await aio.models.generate_content(
+                    model=settings.GEMINI_MODEL_NAME,
+                    contents=full_prompt
+                )
+            else:
+                response = await asyncio.to_thread(
+                    self.client.models.generate_content,
+                    model=settings.GEMINI_MODEL_NAME,
+                    contents=full_prompt
+                )
+            return self._record_turn(task, response)
+        except Exception as e:
+            return f"[{self.role}] Error executing task: {str(e)}"
+    
+    async def run_batch_async(
+        self, tasks: List[str], context: Optional[List[Dict[str, str]]] = None
+    ) -> List[str]:
+        """
+        Execute several independent tasks concurrently.
+        
+        Args:
+            tasks: Task descriptions to execute.
+            context: Optional shared context passed to every task.
+            
+        Returns:
+            Responses in the same order as ``tasks``.
+        """
+        results = await asyncio.gather(
+            *(self.execute_async(task, context) for task in tasks),
+            return_exceptions=True
+        )
+        return [
+            f"[{self.role}] Error executing task: {result}" if isinstance(result, BaseException) else result
+            for result in results
+        ]
     
     def reset_history(self):
-        """Clear the conversation history."""
-        self.conversation_history = []
+        """Clear the conversation history and its summary."""
+        with self._history_lock:
+            self.conversation_history = []
+            self._history_summary = ""
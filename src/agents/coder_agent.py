@@ -15,6 +15,8 @@ class CoderAgent(BaseAgent):
     proper documentation and type hints.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         system_prompt = """You are the Coder Agent, a specialist in software development.
 
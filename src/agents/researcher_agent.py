@@ -15,6 +15,8 @@ class ResearcherAgent(BaseAgent):
     synthesizes findings into actionable insights.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         system_prompt = """You are the Researcher Agent, a specialist in information gathering and analysis.
 
@@ -15,6 +15,8 @@ class ReviewerAgent(BaseAgent):
     issues, and adherence to best practices.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         system_prompt = """You are the Reviewer Agent, a specialist in code quality and security.
 
@@ -5,10 +5,32 @@ This agent acts as the "manager" in the swarm, analyzing user requests,
 determining which specialist agents to involve, and synthesizing final results.
 """
 
-from typing import Dict, List
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Mapping, Optional
 from src.agents.base_agent import BaseAgent
 
 
+# One "- agent: <name>" or "- task: <text>" line of a delegation plan, with
+# surrounding whitespace ignored (the same lines strip() + startswith() accept)
+_DELEGATION_RE = re.compile(r"^[^\S\n]*- (agent|task):[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
+# Routing keywords for the offline fallback. Matched as substrings, so
+# "implemented", "analyzed" or "codebase" route like their stems
+CODER_KEYWORDS = ('code', 'implement', 'build', 'create', 'write', 'function')
+REVIEWER_KEYWORDS = ('review', 'check', 'security', 'quality', 'analyze')
+RESEARCHER_KEYWORDS = ('research', 'search', 'find', 'information', 'learn')
+
+# One precompiled alternation per role instead of a substring test per keyword
+_CODER_RE = re.compile("|".join(map(re.escape, CODER_KEYWORDS)))
+_REVIEWER_RE = re.compile("|".join(map(re.escape, REVIEWER_KEYWORDS)))
+_RESEARCHER_RE = re.compile("|".join(map(re.escape, RESEARCHER_KEYWORDS)))
+
+# Upper bound on concurrent delegations; calls are network-bound, not CPU-bound
+MAX_PARALLEL_DELEGATIONS = 16
+
+
 class RouterAgent(BaseAgent):
     """
     Router agent responsible for task analysis and delegation.
@@ -18,6 +40,8 @@ class RouterAgent(BaseAgent):
     the final response from worker outputs.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         system_prompt = """You are the Router Agent, the coordinator of a multi-agent system.
 
@@ -53,21 +77,20 @@ You may delegate to multiple agents in sequence or parallel."""
         """
         analysis = self.execute(user_task)
         
-        # Parse the delegation plan from the response
+        # Parse the delegation plan from the response in one regex scan
         delegations = []
-        lines = analysis.split('\n')
-        current_delegation = {}
+        current_delegation: Dict[str, str] = {}
         
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- agent:'):
-                if current_delegation:
+        for match in _DELEGATION_RE.finditer(analysis):
+            key, value = match.group(1), match.group(2)
+            if key == 'agent':
+                if 'task' in current_delegation:
                     delegations.append(current_delegation)
-                current_delegation = {'agent': line.split(':', 1)[1].strip()}
-            elif line.startswith('- task:') and current_delegation:
-                current_delegation['task'] = line.split(':', 1)[1].strip()
+                current_delegation = {'agent': value}
+            elif current_delegation:
+                current_delegation['task'] = value
         
-        if current_delegation and 'task' in current_delegation:
+        if 'task' in current_delegation:
             delegations.append(current_delegation)
         
         # Fallback: if no delegations parsed, use simple keyword matching
@@ -90,15 +113,15 @@ You may delegate to multiple agents in sequence or parallel."""
         delegations = []
         
         # Check for code-related keywords
-        if any(word in task_lower for word in ['code', 'implement', 'build', 'create', 'write', 'function']):
+        if _CODER_RE.search(task_lower):
             delegations.append({'agent': 'coder', 'task': task})
         
         # Check for review-related keywords
-        if any(word in task_lower for word in ['review', 'check', 'security', 'quality', 'analyze']):
+        if _REVIEWER_RE.search(task_lower):
             delegations.append({'agent': 'reviewer', 'task': task})
         
         # Check for research-related keywords
-        if any(word in task_lower for word in ['research', 'search', 'find', 'information', 'learn']):
+        if _RESEARCHER_RE.search(task_lower):
             delegations.append({'agent': 'researcher', 'task': task})
         
         # Default to coder if no matches
@@ -107,24 +130,142 @@ You may delegate to multiple agents in sequence or parallel."""
         
         return delegations
     
-    def synthesize_results(self, delegations: List[Dict[str, str]], results: List[str]) -> str:
+    def run_delegations(
+        self,
+        delegations: List[Dict[str, str]],
+        agent_registry: Mapping[str, BaseAgent],
+        contexts: Optional[List[Optional[List[Dict[str, Any]]]]] = None
+    ) -> List[str]:
+        """
+        Run delegations concurrently in a thread pool, one thread per role.
+        
+        Different roles' work is independent and network-bound, so their calls
+        overlap instead of running back to back. Delegations for the same role
+        run in plan order, and each later one gets the earlier results for that
+        role added to its context, as it would have seen them on the message
+        bus in a sequential run. A failure in one call is reported in its
+        result slot and does not affect the others.
+        
+        Args:
+            delegations: The delegation plan from analyze_and_delegate.
+            agent_registry: Mapping of agent role to agent instance.
+            contexts: Optional per-delegation context, aligned with ``delegations``.
+            
+        Returns:
+            Results aligned with ``delegations``.
+        """
+        if not delegations:
+            return []
+        
+        results: List[str] = [""] * len(delegations)
+        
+        # Group delegations by role; each role runs its tasks in order, one execute() per
+        # task, so a later task sees the earlier results. Different roles run in parallel
+        groups: Dict[str, List[int]] = {}
+        for i, delegation in enumerate(delegations):
+            if delegation['agent'] not in agent_registry:
+                results[i] = f"Error: Unknown agent '{delegation['agent']}'"
+                continue
+            groups.setdefault(delegation['agent'], []).append(i)
+        
+        if not groups:
+            return results
+        
+        max_workers = min(len(groups), MAX_PARALLEL_DELEGATIONS)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._run_role_group, agent_registry[role], role, delegations, indices, contexts, results
+                )
+                for role, indices in groups.items()
+            ]
+            for future in as_completed(futures):
+                future.result()
+        
+        return results
+    
+    @staticmethod
+    def _run_role_group(
+        agent: BaseAgent,
+        role: str,
+        delegations: List[Dict[str, str]],
+        indices: List[int],
+        contexts: Optional[List[Optional[List[Dict[str, Any]]]]],
+        results: List[str]
+    ) -> None:
+        """Run one role's delegations in order, writing into ``results``."""
+        earlier: List[Dict[str, Any]] = []
+        for i in indices:
+            context = contexts[i] if contexts else None
+            if context is not None and earlier:
+                context = [*context, *earlier]
+            try:
+                results[i] = agent.execute(delegations[i]['task'], context)
+            except Exception as e:
+                results[i] = f"Error: {e}"
+            earlier.append({"from": role, "to": "router", "type": "result", "content": results[i]})
+    
+    async def run_all_async(
+        self, delegations: List[Dict[str, str]], agents: Mapping[str, BaseAgent]
+    ) -> List[str]:
+        """
+        Run every delegation concurrently on its assigned agent.
+        
+        Args:
+            delegations: The delegation plan from analyze_and_delegate.
+            agents: Mapping of agent role to agent instance.
+            
+        Returns:
+            Results aligned with ``delegations``.
+        """
+        async def _run(delegation: Dict[str, str]) -> str:
+            agent = agents.get(delegation['agent'])
+            if agent is None:
+                return f"Error: Unknown agent '{delegation['agent']}'"
+            return await agent.execute_async(delegation['task'])
+        
+        results = await asyncio.gather(
+            *(_run(delegation) for delegation in delegations),
+            return_exceptions=True
+        )
+        return [
+            f"Error: {result}" if isinstance(result, BaseException) else result
+            for result in results
+        ]
+    
+    def synthesize_results(
+        self,
+        delegations: List[Dict[str, str]],
+        results: List[str],
+        stream: bool = False
+    ) -> str:
         """
         Synthesize final response from multiple agent results.
         
         Args:
             delegations: The original delegation plan.
             results: Results from each delegated agent.
+            stream: Print the synthesis to stdout as it is generated.
             
         Returns:
             Final synthesized response.
         """
-        synthesis_prompt = f"""Synthesize a final response based on the following agent outputs:
-
-"""
+        parts = ["Synthesize a final response based on the following agent outputs:\n\n"]
         for i, (delegation, result) in enumerate(zip(delegations, results), 1):
-            synthesis_prompt += f"{i}. [{delegation['agent']}] {delegation['task']}\n"
-            synthesis_prompt += f"   Result: {result}\n\n"
+            parts.append(
+                f"{i}. [{delegation['agent']}] {delegation['task']}\n"
+                f"   Result: {result}\n\n"
+            )
+        parts.append("Provide a concise final report summarizing what was accomplished.")
+        synthesis_prompt = "".join(parts)
         
-        synthesis_prompt += "Provide a concise final report summarizing what was accomplished."
+        if not stream:
+            return self.execute(synthesis_prompt)
         
-        return self.execute(synthesis_prompt)
+        chunks = []
+        for chunk in self.execute_stream(synthesis_prompt):
+            print(chunk, end="", flush=True)
+            chunks.append(chunk)
+        print()
+        return "".join(chunks).strip()
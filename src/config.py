@@ -1,9 +1,40 @@
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Union
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _orjson = None
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parses JSON with orjson when installed, otherwise with the stdlib.
+
+    Both raise a ValueError subclass on malformed input: json.JSONDecodeError,
+    or UnicodeDecodeError when the stdlib is given bytes that are not UTF-8.
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serializes to UTF-8 JSON bytes with orjson when installed, otherwise with the stdlib.
+
+    Non-ASCII text is written as-is, and ``indent`` pretty-prints with two spaces.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 
 class MCPServerConfig(BaseSettings):
     """Configuration for a single MCP server."""
@@ -23,6 +54,9 @@ class MCPServerConfig(BaseSettings):
         default_factory=dict, description="Environment variables for the server"
     )
     enabled: bool = Field(default=True, description="Whether this server is enabled")
+    max_concurrent: int = Field(
+        default=8, ge=1, description="Maximum in-flight tool calls to this server"
+    )
 
     model_config = SettingsConfigDict(extra="ignore")
 
@@ -37,6 +71,10 @@ class Settings(BaseSettings):
     # Agent Configuration
     AGENT_NAME: str = "AntigravityAgent"
     DEBUG_MODE: bool = False
+    AGENT_THINK_DELAY: float = Field(
+        default=0.0,
+        description="Seconds to pause in think() for demo pacing (0 disables)",
+    )
 
     # External LLM (OpenAI-compatible) Configuration
     OPENAI_BASE_URL: str = Field(
@@ -51,6 +89,10 @@ class Settings(BaseSettings):
         default="gpt-4o-mini",
         description="Default model name for OpenAI-compatible chat completions.",
     )
+    HTTP_COMPRESS_REQUESTS: bool = Field(
+        default=False,
+        description="gzip large chat-completion request bodies; the endpoint must accept Content-Encoding: gzip.",
+    )
 
     # Memory Configuration
     MEMORY_FILE: str = "agent_memory.json"
@@ -74,5 +116,26 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Builds the Settings instance on first use and reuses it afterwards."""
+    return Settings()
+
+
+class _SettingsProxy:
+    """Module-level stand-in that defers reading .env until a field is accessed."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(get_settings(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
+# Global settings instance (loaded lazily on first attribute access)
+settings = _SettingsProxy()
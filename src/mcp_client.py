@@ -14,11 +14,13 @@ This module implements:
 import asyncio
 import json
 import os
+import threading
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
-from src.config import settings, MCPServerConfig
+from src.config import settings, MCPServerConfig, json_dumps, json_loads
 
 
 @dataclass
@@ -30,12 +32,21 @@ class MCPTool:
     server_name: str
     input_schema: Dict[str, Any]
     original_name: str  # Name as defined in MCP server
+    # Caches derived from the fields above; kept out of __eq__ and repr
+    _qualified_name: str = field(init=False, repr=False, compare=False, default="")  # server_tool
+    # Last prefix asked for and the name built from it
+    _name_prefix: str = field(init=False, repr=False, compare=False, default="")
+    _full_name: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        self._qualified_name = self._full_name = f"{self.server_name}_{self.original_name}"
 
     def get_prefixed_name(self, prefix: str = "") -> str:
         """Get the tool name with optional prefix."""
-        if prefix:
-            return f"{prefix}{self.server_name}_{self.original_name}"
-        return f"{self.server_name}_{self.original_name}"
+        if prefix != self._name_prefix:
+            self._name_prefix = prefix
+            self._full_name = prefix + self._qualified_name
+        return self._full_name
 
 
 @dataclass
@@ -49,7 +60,45 @@ class MCPServerConnection:
     tools: List[MCPTool] = field(default_factory=list)
     connected: bool = False
     error: Optional[str] = None
-    _client_cm: Any = None  # Client context manager for cleanup
+    _exit_stack: Optional[AsyncExitStack] = None  # Transport + session contexts
+    _task: Optional[asyncio.Task] = None  # Task that owns the transport contexts
+    _stop: Optional[asyncio.Event] = None  # Set by shutdown() to release them
+    _sem: Optional[asyncio.Semaphore] = None  # Caps in-flight tool calls
+    _pool_key: Optional[Tuple[Any, ...]] = None  # Set when the session is pooled
+
+
+@dataclass
+class _PooledSession:
+    """A live stdio session shared by every manager that spawns the same server."""
+
+    owner: MCPServerConnection  # Connection whose task holds the transport open
+    ready: asyncio.Event  # Set once the owner's connection attempt finished
+    refs: int = 1
+
+    def alive(self) -> bool:
+        return (
+            self.owner.session is not None
+            and self.owner._task is not None
+            and not self.owner._task.done()
+        )
+
+
+# Live stdio sessions keyed by (event loop, command, args, env). Sessions are
+# bound to the loop they were opened on, so only same-loop managers share them;
+# every MCPClientManagerSync runs on the one loop from _acquire_shared_loop().
+_STDIO_POOL: Dict[Tuple[Any, ...], _PooledSession] = {}
+
+
+def _stdio_pool_key(config: MCPServerConfig) -> Optional[Tuple[Any, ...]]:
+    """Pool key for a stdio server, or None for transports that aren't pooled."""
+    if config.transport != "stdio" or not config.command:
+        return None
+    return (
+        asyncio.get_running_loop(),
+        config.command,
+        tuple(config.args),
+        frozenset(config.env.items()),
+    )
 
 
 class MCPClientManager:
@@ -83,24 +132,41 @@ class MCPClientManager:
         self.servers: Dict[str, MCPServerConnection] = {}
         self.tool_prefix = settings.MCP_TOOL_PREFIX
         self._initialized = False
-        self._lock = asyncio.Lock()
+        self._init_task: Optional[asyncio.Task] = None
+        # (mtime_ns, size) of the config file -> configs parsed from it
+        self._config_cache: Optional[Tuple[Tuple[int, int], List[MCPServerConfig]]] = None
+        # Prefixed tool name -> wrapper; rebuilt only when connections change
+        self._callables_cache: Optional[Dict[str, Callable[..., Any]]] = None
+        # Prompt-ready tool listing; same lifetime as the callables cache
+        self._descriptions_cache: Optional[str] = None
+        # Server name -> its tools, for connected servers that expose any
+        self._by_server: Optional[Dict[str, List[MCPTool]]] = None
+        # Prefixed and original tool names -> tool, for name lookups
+        self._tool_index: Optional[Dict[str, MCPTool]] = None
 
     def _load_server_configs(self) -> List[MCPServerConfig]:
         """
         Load MCP server configurations from JSON file.
 
+        The parsed result is reused until the file's mtime or size changes.
+
         Returns:
             List of MCPServerConfig objects
         """
         config_file = Path(self.config_path)
 
-        if not config_file.exists():
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
             print(f"   ⚠️ MCP config file not found: {config_file}")
             return []
 
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._config_cache is not None and self._config_cache[0] == stamp:
+            return list(self._config_cache[1])
+
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_loads(config_file.read_bytes())
 
             servers = data.get("servers", [])
             configs = []
@@ -109,7 +175,8 @@ class MCPClientManager:
                 if server_data.get("enabled", True):
                     configs.append(MCPServerConfig(**server_data))
 
-            return configs
+            self._config_cache = (stamp, configs)
+            return list(configs)
 
         except json.JSONDecodeError as e:
             print(f"   ❌ Invalid JSON in MCP config: {e}")
@@ -126,74 +193,194 @@ class MCPClientManager:
         1. Loads server configurations
         2. Establishes connections to each server
         3. Discovers available tools from each server
+
+        Concurrent callers share one initialization task instead of taking a
+        lock; calls after it has finished return immediately.
         """
-        async with self._lock:
-            if self._initialized:
-                return
+        if self._init_task is None:
+            self._init_task = asyncio.create_task(self._do_initialize())
+        # Shielded so a cancelled caller cannot cancel the shared task
+        await asyncio.shield(self._init_task)
+
+    async def _do_initialize(self) -> None:
+        """Load configs, connect to every server and build the tool cache."""
+        if not settings.MCP_ENABLED:
+            print("   ℹ️ MCP integration is disabled")
+            return
 
-            if not settings.MCP_ENABLED:
-                print("   ℹ️ MCP integration is disabled")
-                return
+        print("🔌 Initializing MCP Client Manager...")
 
-            print("🔌 Initializing MCP Client Manager...")
+        configs = self._load_server_configs()
 
-            configs = self._load_server_configs()
+        if not configs:
+            print("   ℹ️ No MCP servers configured")
+            return
 
-            if not configs:
-                print("   ℹ️ No MCP servers configured")
-                return
+        # Connect to all servers concurrently; each one handles its own
+        # errors, so a failing server never cancels its siblings
+        results = await asyncio.gather(
+            *(self._connect_server(config) for config in configs),
+            return_exceptions=True,
+        )
+
+        # Register in config order so server listings stay deterministic
+        for config, result in zip(configs, results):
+            if isinstance(result, BaseException):
+                print(f"      ⚠️ {config.name}: Connection failed - {result}")
+                result = MCPServerConnection(config=config, error=str(result))
+            self.servers[config.name] = result
+
+        connected_count = sum(1 for s in self.servers.values() if s.connected)
+        total_tools = sum(len(s.tools) for s in self.servers.values())
+
+        print(f"   ✅ Connected to {connected_count}/{len(configs)} MCP servers")
+        print(f"   📦 Discovered {total_tools} MCP tools")
+
+        self._callables_cache = self._build_callables()
+        self._descriptions_cache = self._build_tool_descriptions()
+        self._by_server = self._group_tools_by_server()
+        self._tool_index = self._build_tool_index()
+        self._initialized = True
+
+    async def _connect_server(self, config: MCPServerConfig) -> MCPServerConnection:
+        """
+        Establish connection to a single MCP server.
 
-            for config in configs:
-                await self._connect_server(config)
+        The transport and session are opened by a dedicated task that keeps
+        them open until shutdown(). anyio-based MCP transports must be exited
+        from the task that entered them, which would not hold when several
+        servers connect concurrently and shutdown runs elsewhere.
 
-            connected_count = sum(1 for s in self.servers.values() if s.connected)
-            total_tools = sum(len(s.tools) for s in self.servers.values())
+        Stdio servers are pooled: if another manager on this event loop has
+        already spawned the same command, its live session is reused instead
+        of starting a second subprocess.
 
-            print(f"   ✅ Connected to {connected_count}/{len(configs)} MCP servers")
-            print(f"   📦 Discovered {total_tools} MCP tools")
+        Args:
+            config: Server configuration
 
-            self._initialized = True
+        Returns:
+            The connection, with ``error`` set if it could not be established
+        """
+        key = _stdio_pool_key(config)
+        if key is not None:
+            pooled = _STDIO_POOL.get(key)
+            if pooled is not None:
+                await pooled.ready.wait()
+                if pooled.alive() and _STDIO_POOL.get(key) is pooled:
+                    return await self._attach_pooled(config, key, pooled)
 
-    async def _connect_server(self, config: MCPServerConfig) -> None:
+        connection = MCPServerConnection(config=config)
+        connection._stop = asyncio.Event()
+        ready = asyncio.Event()
+        if key is not None:
+            # Registered before awaiting so concurrent connects share this spawn
+            connection._pool_key = key
+            _STDIO_POOL[key] = _PooledSession(owner=connection, ready=ready)
+        connection._task = asyncio.create_task(self._run_connection(connection, ready))
+        await ready.wait()
+        if key is not None and not connection.connected:
+            if _STDIO_POOL.get(key) is not None and _STDIO_POOL[key].owner is connection:
+                del _STDIO_POOL[key]
+            connection._pool_key = None
+        return connection
+
+    async def _attach_pooled(
+        self, config: MCPServerConfig, key: Tuple[Any, ...], pooled: _PooledSession
+    ) -> MCPServerConnection:
+        """Create a connection that shares a pooled stdio session."""
+        owner = pooled.owner
+        pooled.refs += 1
+        connection = MCPServerConnection(
+            config=config,
+            session=owner.session,
+            read_stream=owner.read_stream,
+            write_stream=owner.write_stream,
+            connected=True,
+            _sem=owner._sem,
+            _pool_key=key,
+        )
+        await self._discover_tools(connection)
+        print(
+            f"      ✓ {config.name}: reusing running server, {len(connection.tools)} tools discovered"
+        )
+        return connection
+
+    async def _release_connection(self, connection: MCPServerConnection) -> None:
         """
-        Establish connection to a single MCP server.
+        Drop this manager's hold on a connection, closing it if no one else uses it.
 
         Args:
-            config: Server configuration
+            connection: Connection registered in ``self.servers``
         """
-        connection = MCPServerConnection(config=config)
+        owner = connection
+        if connection._pool_key is not None:
+            pooled = _STDIO_POOL.get(connection._pool_key)
+            if pooled is not None and pooled.owner.session is connection.session:
+                pooled.refs -= 1
+                if pooled.refs > 0:
+                    connection.connected = False
+                    return
+                del _STDIO_POOL[connection._pool_key]
+                owner = pooled.owner
+
+        connection.connected = False
+        if owner._task:
+            # The owning task unwinds the exit stack it entered
+            owner._stop.set()
+            await owner._task
+
+    async def _run_connection(
+        self, connection: MCPServerConnection, ready: asyncio.Event
+    ) -> None:
+        """
+        Open a server connection, hold it until shutdown, then close it.
 
-        try:
-            print(
-                f"   🔗 Connecting to MCP server: {config.name} ({config.transport})..."
-            )
+        Args:
+            connection: Connection to open; updated in place
+            ready: Set once the connection attempt has finished
+        """
+        config = connection.config
 
-            if config.transport == "stdio":
-                await self._connect_stdio(connection)
-            elif config.transport in ("http", "streamable-http"):
-                await self._connect_http(connection)
-            elif config.transport == "sse":
-                await self._connect_sse(connection)
-            else:
-                raise ValueError(f"Unsupported transport: {config.transport}")
-
-            # Discover tools if connected
-            if connection.connected and connection.session:
-                await self._discover_tools(connection)
+        # The stack unwinds in this task whether connecting fails or
+        # shutdown() releases a live connection
+        async with AsyncExitStack() as stack:
+            connection._exit_stack = stack
+            try:
                 print(
-                    f"      ✓ {config.name}: {len(connection.tools)} tools discovered"
+                    f"   🔗 Connecting to MCP server: {config.name} ({config.transport})..."
                 )
 
-        except ImportError as e:
-            connection.error = f"MCP library not installed: {e}"
-            print(
-                f"      ⚠️ {config.name}: MCP library not installed. Run: pip install 'mcp[cli]'"
-            )
-        except Exception as e:
-            connection.error = str(e)
-            print(f"      ⚠️ {config.name}: Connection failed - {e}")
+                if config.transport == "stdio":
+                    await self._connect_stdio(connection)
+                elif config.transport in ("http", "streamable-http"):
+                    await self._connect_http(connection)
+                elif config.transport == "sse":
+                    await self._connect_sse(connection)
+                else:
+                    raise ValueError(f"Unsupported transport: {config.transport}")
+
+                # Discover tools if connected
+                if connection.connected and connection.session:
+                    connection._sem = asyncio.Semaphore(config.max_concurrent)
+                    await self._discover_tools(connection)
+                    print(
+                        f"      ✓ {config.name}: {len(connection.tools)} tools discovered"
+                    )
+
+            except ImportError as e:
+                connection.error = f"MCP library not installed: {e}"
+                print(
+                    f"      ⚠️ {config.name}: MCP library not installed. Run: pip install 'mcp[cli]'"
+                )
+            except Exception as e:
+                connection.error = str(e)
+                print(f"      ⚠️ {config.name}: Connection failed - {e}")
+            finally:
+                ready.set()
 
-        self.servers[config.name] = connection
+            if connection.connected:
+                await connection._stop.wait()
+            connection.connected = False
 
     async def _connect_stdio(self, connection: MCPServerConnection) -> None:
         """Connect to an MCP server using stdio transport."""
@@ -212,18 +399,19 @@ class MCPClientManager:
                 env={**os.environ, **config.env},
             )
 
-            # Create the client context
-            # Note: We need to manage the async context carefully
-            client_cm = stdio_client(server_params)
-            read_stream, write_stream = await client_cm.__aenter__()
+            # Contexts are registered on the connection's exit stack for cleanup
+            stack = connection._exit_stack
+            read_stream, write_stream = await stack.enter_async_context(
+                stdio_client(server_params)
+            )
 
             connection.read_stream = read_stream
             connection.write_stream = write_stream
-            connection._client_cm = client_cm  # Store for cleanup
 
             # Create session
-            session = ClientSession(read_stream, write_stream)
-            await session.__aenter__()
+            session = await stack.enter_async_context(
+                ClientSession(read_stream, write_stream)
+            )
             await session.initialize()
 
             connection.session = session
@@ -245,17 +433,19 @@ class MCPClientManager:
             if not config.url:
                 raise ValueError("http transport requires 'url' field")
 
-            # Create the client context
-            client_cm = streamablehttp_client(config.url)
-            read_stream, write_stream, _ = await client_cm.__aenter__()
+            # Contexts are registered on the connection's exit stack for cleanup
+            stack = connection._exit_stack
+            read_stream, write_stream, _ = await stack.enter_async_context(
+                streamablehttp_client(config.url)
+            )
 
             connection.read_stream = read_stream
             connection.write_stream = write_stream
-            connection._client_cm = client_cm
 
             # Create session
-            session = ClientSession(read_stream, write_stream)
-            await session.__aenter__()
+            session = await stack.enter_async_context(
+                ClientSession(read_stream, write_stream)
+            )
             await session.initialize()
 
             connection.session = session
@@ -286,17 +476,17 @@ class MCPClientManager:
         try:
             tools_response = await connection.session.list_tools()
 
-            for tool in tools_response.tools:
-                mcp_tool = MCPTool(
-                    name=tool.name,
-                    description=tool.description or "No description provided",
-                    server_name=connection.config.name,
-                    input_schema=tool.inputSchema
-                    if hasattr(tool, "inputSchema")
-                    else {},
-                    original_name=tool.name,
+            server_name = connection.config.name
+            connection.tools = [
+                MCPTool(
+                    tool.name,
+                    tool.description or "No description provided",
+                    server_name,
+                    getattr(tool, "inputSchema", None) or {},
+                    tool.name,
                 )
-                connection.tools.append(mcp_tool)
+                for tool in tools_response.tools
+            ]
 
         except Exception as e:
             print(f"      ⚠️ Error discovering tools: {e}")
@@ -314,13 +504,66 @@ class MCPClientManager:
                 all_tools.extend(connection.tools)
         return all_tools
 
+    def get_tools_by_server(self) -> Dict[str, List[MCPTool]]:
+        """
+        Get discovered tools grouped by server.
+
+        The mapping is built once per set of connections and reused; treat
+        it as read-only.
+
+        Returns:
+            Dictionary mapping server names to their tools, in config order
+        """
+        if self._by_server is None:
+            self._by_server = self._group_tools_by_server()
+        return self._by_server
+
+    def _group_tools_by_server(self) -> Dict[str, List[MCPTool]]:
+        return {
+            name: connection.tools
+            for name, connection in self.servers.items()
+            if connection.connected and connection.tools
+        }
+
+    def find_tool(self, name: str) -> Optional[MCPTool]:
+        """
+        Look up a tool by its prefixed or original name.
+
+        Prefixed names win; when several servers share an original name the
+        first server in config order wins.
+
+        Args:
+            name: Prefixed or original tool name
+
+        Returns:
+            The matching MCPTool, or None
+        """
+        if self._tool_index is None:
+            self._tool_index = self._build_tool_index()
+        return self._tool_index.get(name)
+
+    def _build_tool_index(self) -> Dict[str, MCPTool]:
+        tools = self.get_all_tools()
+        index = {tool.get_prefixed_name(self.tool_prefix): tool for tool in tools}
+        for tool in tools:
+            index.setdefault(tool.original_name, tool)
+        return index
+
     def get_all_tools_as_callables(self) -> Dict[str, Callable[..., Any]]:
         """
         Convert all MCP tools to callable functions.
 
+        The mapping is built once per set of connections and reused.
+
         Returns:
             Dictionary mapping tool names to async callable functions
         """
+        if self._callables_cache is None:
+            self._callables_cache = self._build_callables()
+        return self._callables_cache
+
+    def _build_callables(self) -> Dict[str, Callable[..., Any]]:
+        """Create wrappers for every tool on a connected server."""
         callables = {}
 
         for connection in self.servers.values():
@@ -344,59 +587,11 @@ class MCPClientManager:
             tool: Tool metadata
 
         Returns:
-            Async callable function that invokes the MCP tool
+            Async callable that invokes the MCP tool
         """
-
-        async def tool_wrapper(**kwargs) -> Any:
-            """
-            Wrapper function that calls the MCP tool.
-
-            This function is dynamically created for each MCP tool and handles:
-            - Argument validation
-            - Tool invocation via MCP protocol
-            - Result extraction and formatting
-            - Error handling
-            """
-            if not connection.connected or not connection.session:
-                return f"Error: MCP server '{connection.config.name}' is not connected"
-
-            try:
-                result = await connection.session.call_tool(
-                    tool.original_name, arguments=kwargs
-                )
-
-                # Extract content from result
-                if hasattr(result, "content") and result.content:
-                    contents = []
-                    for content in result.content:
-                        if hasattr(content, "text"):
-                            contents.append(content.text)
-                        elif hasattr(content, "data"):
-                            contents.append(f"[Binary data: {len(content.data)} bytes]")
-                    return "\n".join(contents) if contents else str(result)
-
-                # Check for structured content
-                if hasattr(result, "structuredContent") and result.structuredContent:
-                    return result.structuredContent
-
-                return str(result)
-
-            except Exception as e:
-                return f"Error calling MCP tool '{tool.original_name}': {e}"
-
-        # Set function metadata for agent tool discovery
-        tool_wrapper.__name__ = tool.get_prefixed_name(self.tool_prefix)
-        tool_wrapper.__doc__ = f"""[MCP:{connection.config.name}] {tool.description}
-
-Server: {connection.config.name}
-Original Name: {tool.original_name}
-Transport: {connection.config.transport}
-
-Input Schema:
-{json.dumps(tool.input_schema, indent=2) if tool.input_schema else "No schema defined"}
-"""
-
-        return tool_wrapper
+        return _MCPToolWrapper(
+            tool.get_prefixed_name(self.tool_prefix), connection, tool
+        )
 
     def get_tool_descriptions(self) -> str:
         """
@@ -405,6 +600,12 @@ Input Schema:
         Returns:
             Formatted string with tool descriptions for prompt injection
         """
+        if self._descriptions_cache is None:
+            self._descriptions_cache = self._build_tool_descriptions()
+        return self._descriptions_cache
+
+    def _build_tool_descriptions(self) -> str:
+        """Format one prompt line per tool on a connected server."""
         descriptions = []
 
         for connection in self.servers.values():
@@ -433,17 +634,38 @@ Input Schema:
         Returns:
             Tuple of (success, result)
         """
-        callables = self.get_all_tools_as_callables()
+        tool_fn = self.get_all_tools_as_callables().get(tool_name)
 
-        if tool_name not in callables:
+        if tool_fn is None:
             return False, f"Tool '{tool_name}' not found"
 
         try:
-            result = await callables[tool_name](**arguments)
+            result = await tool_fn(**arguments)
             return True, result
         except Exception as e:
             return False, str(e)
 
+    async def call_tools(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Tuple[bool, Any]]:
+        """
+        Call several independent MCP tools concurrently.
+
+        Calls to different servers run in parallel, and calls to the same
+        server are bounded by its ``max_concurrent`` limit.
+
+        Args:
+            calls: (prefixed tool name, arguments) pairs
+
+        Returns:
+            (success, result) tuples in the same order as ``calls``
+        """
+        return list(
+            await asyncio.gather(
+                *(self.call_tool(tool_name, arguments) for tool_name, arguments in calls)
+            )
+        )
+
     async def shutdown(self) -> None:
         """
         Gracefully close all MCP server connections.
@@ -452,15 +674,17 @@ Input Schema:
 
         for name, connection in self.servers.items():
             try:
-                if connection.session:
-                    await connection.session.__aexit__(None, None, None)
-                if hasattr(connection, "_client_cm"):
-                    await connection._client_cm.__aexit__(None, None, None)
+                await self._release_connection(connection)
                 print(f"   ✓ Disconnected from {name}")
             except Exception as e:
                 print(f"   ⚠️ Error disconnecting from {name}: {e}")
 
         self.servers.clear()
+        self._callables_cache = None
+        self._descriptions_cache = None
+        self._by_server = None
+        self._tool_index = None
+        self._init_task = None
         self._initialized = False
 
     def get_status(self) -> Dict[str, Any]:
@@ -485,60 +709,196 @@ Input Schema:
         }
 
 
+class _MCPToolWrapper:
+    # Async callable standing in for a tool function. Agents discover tools
+    # through __name__ and __doc__; the doc (with its JSON schema dump) is
+    # only formatted the first time something reads it.
+
+    __slots__ = ("__name__", "_connection", "_tool", "_doc")
+
+    def __init__(
+        self, name: str, connection: MCPServerConnection, tool: MCPTool
+    ) -> None:
+        self.__name__ = name
+        self._connection = connection
+        self._tool = tool
+        self._doc: Optional[str] = None
+
+    @property
+    def __doc__(self) -> str:  # type: ignore[override]
+        if self._doc is None:
+            config = self._connection.config
+            tool = self._tool
+            schema = (
+                json_dumps(tool.input_schema, indent=True).decode("utf-8")
+                if tool.input_schema
+                else "No schema defined"
+            )
+            self._doc = f"""[MCP:{config.name}] {tool.description}
+
+Server: {config.name}
+Original Name: {tool.original_name}
+Transport: {config.transport}
+
+Input Schema:
+{schema}
+"""
+        return self._doc
+
+    async def __call__(self, **kwargs) -> Any:
+        """
+        Call the MCP tool.
+
+        Handles tool invocation via the MCP protocol, result extraction and
+        formatting, and error handling.
+        """
+        connection = self._connection
+        tool = self._tool
+        if not connection.connected or not connection.session:
+            return f"Error: MCP server '{connection.config.name}' is not connected"
+
+        try:
+            # Bound per-server concurrency so pipes and sockets aren't flooded
+            async with connection._sem:
+                result = await connection.session.call_tool(
+                    tool.original_name, arguments=kwargs
+                )
+
+            # Extract content from result
+            result_content = getattr(result, "content", None)
+            if result_content:
+                contents: List[str] = []
+                append = contents.append
+                for content in result_content:
+                    text = getattr(content, "text", None)
+                    if text is not None:
+                        append(text)
+                        continue
+                    data = getattr(content, "data", None)
+                    if data is not None:
+                        append(f"[Binary data: {len(data)} bytes]")
+                return "\n".join(contents) if contents else str(result)
+
+            # Check for structured content
+            structured = getattr(result, "structuredContent", None)
+            if structured:
+                return structured
+
+            return str(result)
+
+        except Exception as e:
+            return f"Error calling MCP tool '{tool.original_name}': {e}"
+
+
+class _SyncToolWrapper:
+    # Blocking facade over an async tool; __doc__ is forwarded on read so
+    # the async wrapper's lazy formatting is preserved.
+
+    __slots__ = ("__name__", "_afn", "_run")
+
+    def __init__(self, afn: Callable[..., Any], run: Callable[[Any], Any]) -> None:
+        self.__name__ = afn.__name__
+        self._afn = afn
+        self._run = run
+
+    @property
+    def __doc__(self) -> Optional[str]:  # type: ignore[override]
+        return self._afn.__doc__
+
+    def __call__(self, **kwargs) -> Any:
+        return self._run(self._afn(**kwargs))
+
+
 # Synchronous wrapper for use in non-async contexts
+# Background event loop shared by every MCPClientManagerSync, so that their
+# stdio sessions can come from the same _STDIO_POOL. Started by the first
+# manager and stopped when the last one shuts down.
+_SHARED_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SHARED_LOOP_THREAD: Optional[threading.Thread] = None
+_SHARED_LOOP_USERS = 0
+_SHARED_LOOP_LOCK = threading.Lock()
+
+
+def _acquire_shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting it if needed."""
+    global _SHARED_LOOP, _SHARED_LOOP_THREAD, _SHARED_LOOP_USERS
+    with _SHARED_LOOP_LOCK:
+        if _SHARED_LOOP is None:
+            _SHARED_LOOP = asyncio.new_event_loop()
+            _SHARED_LOOP_THREAD = threading.Thread(
+                target=_SHARED_LOOP.run_forever, name="mcp-event-loop", daemon=True
+            )
+            _SHARED_LOOP_THREAD.start()
+        _SHARED_LOOP_USERS += 1
+        return _SHARED_LOOP
+
+
+def _release_shared_loop() -> None:
+    """Drop one user of the shared loop; the last one stops and closes it."""
+    global _SHARED_LOOP, _SHARED_LOOP_THREAD, _SHARED_LOOP_USERS
+    with _SHARED_LOOP_LOCK:
+        _SHARED_LOOP_USERS -= 1
+        if _SHARED_LOOP_USERS > 0:
+            return
+        loop, thread = _SHARED_LOOP, _SHARED_LOOP_THREAD
+        _SHARED_LOOP = _SHARED_LOOP_THREAD = None
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
 class MCPClientManagerSync:
     """
     Synchronous wrapper for MCPClientManager.
 
     Provides blocking methods for environments that don't support async/await.
+    All coroutines run on one event loop owned by a background thread, shared
+    by every instance, so tool calls from several threads can be in flight at
+    the same time and instances that start the same stdio server share it.
     """
 
     def __init__(self, config_path: Optional[str] = None):
         self._async_manager = MCPClientManager(config_path)
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = _acquire_shared_loop()
 
-    def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get or create an event loop."""
-        try:
-            return asyncio.get_running_loop()
-        except RuntimeError:
-            if self._loop is None or self._loop.is_closed():
-                self._loop = asyncio.new_event_loop()
-            return self._loop
+    def _run(self, coro) -> Any:
+        """Run a coroutine on the background loop and block for its result."""
+        if self._loop is None:
+            # Used again after shutdown()
+            self._loop = _acquire_shared_loop()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     def initialize(self) -> None:
         """Initialize MCP connections synchronously."""
-        loop = self._get_loop()
-        loop.run_until_complete(self._async_manager.initialize())
+        self._run(self._async_manager.initialize())
 
     def get_all_tools_as_callables(self) -> Dict[str, Callable[..., Any]]:
         """Get all tools as sync-wrapped callables."""
         async_callables = self._async_manager.get_all_tools_as_callables()
-        sync_callables = {}
-
-        for name, async_fn in async_callables.items():
-
-            def make_sync_wrapper(afn):
-                def sync_wrapper(**kwargs):
-                    loop = self._get_loop()
-                    return loop.run_until_complete(afn(**kwargs))
-
-                sync_wrapper.__name__ = afn.__name__
-                sync_wrapper.__doc__ = afn.__doc__
-                return sync_wrapper
-
-            sync_callables[name] = make_sync_wrapper(async_fn)
+        return {
+            name: _SyncToolWrapper(async_fn, self._run)
+            for name, async_fn in async_callables.items()
+        }
 
-        return sync_callables
+    def call_tools(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Tuple[bool, Any]]:
+        """Call several MCP tools concurrently and wait for all results."""
+        return self._run(self._async_manager.call_tools(calls))
 
     def get_tool_descriptions(self) -> str:
         """Get tool descriptions."""
         return self._async_manager.get_tool_descriptions()
 
     def shutdown(self) -> None:
-        """Shutdown connections."""
-        loop = self._get_loop()
-        loop.run_until_complete(self._async_manager.shutdown())
+        """Shutdown connections and release the background event loop."""
+        if self._loop is None:
+            return
+        try:
+            self._run(self._async_manager.shutdown())
+        finally:
+            self._loop = None
+            _release_shared_loop()
 
     def get_status(self) -> Dict[str, Any]:
         """Get status information."""
@@ -1,59 +1,118 @@
-import json
 import os
-from typing import Any, Callable, Dict, List, Optional
-from src.config import settings
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.config import json_dumps, json_loads, settings
 
 
 class MemoryManager:
-    """Simple JSON-file based memory manager for the agent."""
+    """
+    Simple JSON-file based memory manager for the agent.
 
-    def __init__(self, memory_file: str = settings.MEMORY_FILE):
-        self.memory_file = memory_file
+    The summary lives in ``memory_file``; the history is an append-only JSON
+    Lines file next to it (``agent_memory.json`` -> ``agent_memory.jsonl``),
+    so recording a turn writes one line instead of the whole conversation.
+    """
+
+    def __init__(self, memory_file: Optional[str] = None):
+        self.memory_file = memory_file or settings.MEMORY_FILE
+        self.history_file = os.path.splitext(self.memory_file)[0] + ".jsonl"
         self.summary: str = ""
         self._memory: List[Dict[str, Any]] = []
         self._load_memory()
 
     def _load_memory(self):
-        """Loads memory from the JSON file if it exists."""
+        """Loads the summary and history from disk if they exist."""
         self.summary = ""
+        self._memory = []
+        legacy_history = None
         if os.path.exists(self.memory_file):
             try:
-                with open(self.memory_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.memory_file, 'rb') as f:
+                    data = json_loads(f.read())
                 if isinstance(data, dict):
                     self.summary = data.get("summary", "") or ""
-                    history = data.get("history", [])
-                    self._memory = history if isinstance(history, list) else []
+                    history = data.get("history")
+                    if isinstance(history, list):
+                        legacy_history = history
                 elif isinstance(data, list):
                     # Backward compatibility for legacy memory files
-                    self._memory = data
+                    legacy_history = data
                 else:
                     print(f"Warning: Unexpected memory format in {self.memory_file}. Starting fresh.")
-                    self._memory = []
-            except json.JSONDecodeError:
+            except ValueError:
                 print(f"Warning: Could not decode memory file {self.memory_file}. Starting fresh.")
-                self._memory = []
-        else:
-            self._memory = []
+
+        if os.path.exists(self.history_file):
+            entries, skipped = self._read_history_lines()
+            self._memory = self._normalize_history(entries)
+            if skipped:
+                # Rewrite so later appends don't land on a torn line
+                self.save_memory()
+        elif legacy_history:
+            # History embedded in the JSON file: migrate it to the JSONL log
+            self._memory = self._normalize_history(legacy_history)
+            self.save_memory()
+
+    def _read_history_lines(self) -> Tuple[List[Any], int]:
+        """Reads the JSONL history, skipping lines that fail to decode (e.g. a torn last write).
+
+        Returns:
+            The decoded entries and the number of lines skipped.
+        """
+        entries = []
+        skipped = 0
+        with open(self.history_file, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json_loads(line))
+                except ValueError:
+                    # JSONDecodeError, or UnicodeDecodeError from the stdlib
+                    # fallback when the line was cut inside a UTF-8 sequence
+                    skipped += 1
+                    print(f"Warning: Skipping corrupt line {line_number} in {self.history_file}.")
+        return entries, skipped
+
+    @staticmethod
+    def _normalize_history(history: List[Any]) -> List[Dict[str, Any]]:
+        """Ensures every loaded entry has 'role' and 'content' keys so readers can index directly."""
+        normalized = []
+        for entry in history:
+            if not isinstance(entry, dict):
+                continue
+            entry.setdefault("role", "unknown")
+            entry.setdefault("content", "")
+            normalized.append(entry)
+        return normalized
 
     def save_memory(self):
-        """Saves the current memory state to the JSON file."""
-        payload = {
-            "summary": self.summary,
-            "history": self._memory,
-        }
-        with open(self.memory_file, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        """Rewrites the summary and the full history to disk."""
+        self._save_summary()
+        tmp_path = f"{self.history_file}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.writelines(self._encode_entry(entry) for entry in self._memory)
+        os.replace(tmp_path, self.history_file)
+
+    def _save_summary(self):
+        """Writes only the summary file; the history log is left untouched."""
+        with open(self.memory_file, 'wb') as f:
+            f.write(json_dumps({"summary": self.summary}, indent=True))
+
+    @staticmethod
+    def _encode_entry(entry: Dict[str, Any]) -> bytes:
+        """Serializes one history entry as a JSON Lines record."""
+        return json_dumps(entry) + b"\n"
 
     def add_entry(self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None):
-        """Adds a new interaction to memory."""
+        """Adds a new interaction to memory and appends it to the history log."""
         entry = {
             "role": role,
             "content": content,
             "metadata": metadata or {}
         }
         self._memory.append(entry)
-        self.save_memory()
+        with open(self.history_file, 'ab') as f:
+            f.write(self._encode_entry(entry))
 
     def get_history(self) -> List[Dict[str, Any]]:
         """Returns the full conversation history."""
@@ -63,15 +122,12 @@ class MemoryManager:
         """
         Fallback summarization that compacts old messages.
         Concatenates previous summary (if any) with role-tagged message content.
+        History entries are normalized on load and on add, so 'role' and
+        'content' are indexed directly.
         """
-        lines: List[str] = []
-        if previous_summary:
-            lines.append(previous_summary.strip())
-        for message in old_messages:
-            role = message.get("role", "unknown")
-            content = message.get("content", "")
-            lines.append(f"{role}: {content}")
-        return "\n".join(lines).strip()
+        parts = [previous_summary.strip()] if previous_summary else []
+        parts.extend(f"{message['role']}: {message['content']}" for message in old_messages)
+        return "\n".join(parts).strip()
 
     def get_context_window(
         self,
@@ -87,6 +143,9 @@ class MemoryManager:
             max_messages: Maximum number of recent history messages to keep verbatim.
             summarizer: Callable that receives (old_messages, previous_summary) and returns a summary string.
 
+        History messages in the result (and those passed to the summarizer) are
+        the stored entries themselves, not copies; callers must not mutate them.
+
         Raises:
             ValueError: If system_prompt is empty, max_messages is invalid, or summarizer returns non-string.
             TypeError: If summarizer does not accept the required arguments.
@@ -103,8 +162,8 @@ class MemoryManager:
             return [system_message, *history]
 
         summarizer_fn = summarizer or self._default_summarizer
-        messages_to_summarize = [dict(msg) for msg in history[:-max_messages]]
-        recent_history = [dict(msg) for msg in history[-max_messages:]]
+        messages_to_summarize = history[:-max_messages]
+        recent_history = history[-max_messages:]
 
         try:
             new_summary = summarizer_fn(messages_to_summarize, self.summary)
@@ -117,7 +176,7 @@ class MemoryManager:
         previous_summary = self.summary
         self.summary = new_summary.strip()
         if self.summary != previous_summary:
-            self.save_memory()
+            self._save_summary()
 
         summary_message = {
             "role": "system",
@@ -1,10 +1,11 @@
 from .base import ExecutionResult, CodeSandbox
-from .factory import get_sandbox
+from .factory import get_sandbox, reset_sandbox
 from .local import LocalSandbox
 
 __all__ = [
     "ExecutionResult",
     "CodeSandbox",
     "get_sandbox",
+    "reset_sandbox",
     "LocalSandbox",
 ]
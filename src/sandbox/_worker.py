@@ -0,0 +1,226 @@
+"""Long-lived interpreter that runs LocalSandbox jobs.
+
+Started by :mod:`src.sandbox.pool` and driven over stdin/stdout with
+length-prefixed JSON frames: ``{"code", "cwd", "timeout", "max_bytes"}`` in,
+``{"stdout", "stderr", "exit_code", "timed_out", "truncated"}`` out. Each job
+runs in a forked child so it is as isolated as a fresh ``python -`` run in
+``cwd``, while interpreter startup is paid only once. With ``cwd`` null the
+job instead gets its own temp dir and runs as ``python main.py`` there.
+
+Jobs run in their own process group, which is killed once ``timeout``
+passes so a runaway loop cannot outlive the job. Output past ``max_bytes``
+per stream (0 means no cap) is read and discarded, and the reply flags it.
+
+This file is executed as a script and must not import anything from ``src``.
+"""
+
+import builtins
+import json
+import linecache
+import os
+import selectors
+import shutil
+import signal
+import struct
+import sys
+import tempfile
+import time
+import traceback
+import types
+
+_HEADER = struct.Struct(">I")
+
+
+def _read_exact(fd, size):
+    chunks = []
+    while size:
+        chunk = os.read(fd, min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _write_frame(fd, obj):
+    data = json.dumps(obj).encode("utf-8")
+    view = memoryview(_HEADER.pack(len(data)) + data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _run_child(code, cwd, script_path, out_fd, err_fd, inherited_fds):
+    # Never returns: the child leaves through SystemExit so the regular
+    # interpreter shutdown still joins threads and runs atexit hooks
+    os.setpgid(0, 0)
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    for fd in inherited_fds:
+        os.close(fd)
+
+    os.chdir(cwd)
+    main = types.ModuleType("__main__")
+    main.__builtins__ = builtins
+    sys.modules["__main__"] = main
+
+    if script_path is None:
+        # Same view as ``python -``; linecache keeps source in tracebacks
+        filename = "<stdin>"
+        sys.argv = ["-"]
+        sys.path[0] = ""
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+    else:
+        filename = script_path
+        sys.argv = [script_path]
+        sys.path[0] = cwd
+    main.__file__ = filename
+
+    try:
+        exec(compile(code, filename, "exec"), main.__dict__)
+    except SystemExit:
+        raise
+    except BaseException as exc:
+        # Drop this frame so the traceback looks like a plain script run
+        traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+        raise SystemExit(1)
+    raise SystemExit(0)
+
+
+def _kill_group(pid):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _collect(pid, out_fd, err_fd, timeout, cap):
+    # Read both pipes until EOF or the deadline, keeping at most ``cap``
+    # bytes of each, then reap
+    deadline = time.monotonic() + timeout
+    bufs = {out_fd: bytearray(), err_fd: bytearray()}
+    timed_out = truncated = False
+
+    with selectors.DefaultSelector() as sel:
+        for fd in bufs:
+            sel.register(fd, selectors.EVENT_READ)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fd)
+                    continue
+                buf = bufs[key.fd]
+                room = cap - len(buf) if cap else len(chunk)
+                if room < len(chunk):
+                    truncated = True
+                if room > 0:
+                    buf += chunk[:room]
+
+    # Pipes can close before the process exits; keep the deadline
+    delay = 0.001
+    while not timed_out:
+        reaped, status = os.waitpid(pid, os.WNOHANG)
+        if reaped:
+            return bufs[out_fd], bufs[err_fd], os.waitstatus_to_exitcode(status), False, truncated
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            timed_out = True
+            break
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.05)
+
+    _kill_group(pid)
+    _, status = os.waitpid(pid, 0)
+    return bufs[out_fd], bufs[err_fd], os.waitstatus_to_exitcode(status), timed_out, truncated
+
+
+def _run_job(code, cwd, timeout, max_bytes, proto_fds):
+    tmpdir = script_path = None
+    if cwd is None:
+        tmpdir = tempfile.mkdtemp(prefix="ag_sandbox_")
+        script_path = os.path.join(tmpdir, "main.py")
+        with open(script_path, "w", encoding="utf-8") as f:
+            f.write(code)
+
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        _run_child(
+            code, cwd or tmpdir, script_path, out_w, err_w,
+            (*proto_fds, out_r, out_w, err_r, err_w),
+        )
+
+    try:
+        # Also set from this side so killpg works before the child gets there
+        os.setpgid(pid, pid)
+    except OSError:
+        pass
+    os.close(out_w)
+    os.close(err_w)
+
+    # Keep some slack over the caller's limit so it can still mark truncation
+    cap = max_bytes * 2 if max_bytes > 0 else 0
+    try:
+        out, err, exit_code, timed_out, truncated = _collect(pid, out_r, err_r, timeout, cap)
+    finally:
+        os.close(out_r)
+        os.close(err_r)
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    return {
+        "stdout": out.decode("utf-8", errors="replace"),
+        "stderr": err.decode("utf-8", errors="replace"),
+        "exit_code": exit_code,
+        "timed_out": timed_out,
+        "truncated": truncated,
+    }
+
+
+def main():
+    # Keep private copies of the protocol pipes and point the standard fds
+    # at /dev/null, so stray writes (or reads) never touch the protocol
+    proto_in = os.dup(0)
+    proto_out = os.dup(1)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
+
+    while True:
+        header = _read_exact(proto_in, _HEADER.size)
+        if header is None:
+            return
+        (size,) = _HEADER.unpack(header)
+        body = _read_exact(proto_in, size)
+        if body is None:
+            return
+
+        try:
+            request = json.loads(body)
+            reply = _run_job(
+                request["code"],
+                request["cwd"],
+                request["timeout"],
+                request["max_bytes"],
+                (proto_in, proto_out),
+            )
+        except Exception as exc:
+            reply = {
+                "stdout": "",
+                "stderr": f"Unexpected execution error: {exc}",
+                "exit_code": 1,
+                "timed_out": False,
+                "truncated": False,
+            }
+        _write_frame(proto_out, reply)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
 import os
 import tempfile
+from contextlib import ExitStack
+import threading
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from .base import CodeSandbox, ExecutionResult
+from .local import _truncate_output
+
+
+# Code up to this size is passed inline via ``python -c`` (well under the
+# kernel's 128 KiB per-argument limit); larger scripts are bind-mounted
+INLINE_CODE_MAX_BYTES = 100_000
 
 
 class DockerSandbox(CodeSandbox):
@@ -14,19 +22,51 @@ class DockerSandbox(CodeSandbox):
     returns a structured error via ExecutionResult when unavailable.
     """
 
-    def _docker_available(self) -> tuple[bool, Optional[str]]:
-        try:
-            import docker  # type: ignore
+    # One client per process: from_env() negotiates the API version and the
+    # daemon is pinged once, on first use, instead of on every execute()
+    _client: Any = None
+    _client_lock = threading.Lock()
+
+    @classmethod
+    def _get_client(cls) -> Any:
+        with cls._client_lock:
+            if cls._client is None:
+                import docker  # type: ignore
 
-            try:
                 client = docker.from_env()
                 # ping the daemon to verify connectivity
                 client.ping()
-                return True, None
-            except Exception as exc:  # daemon not reachable
-                return False, f"Docker daemon not available: {exc}"
+                cls._client = client
+            return cls._client
+
+    def _docker_available(self) -> tuple[bool, Optional[str]]:
+        try:
+            import docker  # type: ignore  # noqa: F401
         except Exception as exc:  # SDK not installed
             return False, f"Docker SDK not installed: {exc}"
+        try:
+            # Only a successful connection is cached, so a daemon started later is picked up
+            self._get_client()
+            return True, None
+        except Exception as exc:  # daemon not reachable
+            return False, f"Docker daemon not available: {exc}"
+
+    @staticmethod
+    def _kill(container: Any) -> None:
+        try:
+            container.kill()
+        except Exception:
+            # Best-effort cleanup: ignore errors if the container is already
+            # stopped, missing, or cannot be killed.
+            pass
+
+    @staticmethod
+    def _remove(container: Any) -> None:
+        try:
+            container.remove(force=True)
+        except Exception:
+            # Best-effort cleanup: the daemon may already be gone
+            pass
 
     def execute(self, code: str, language: str = "python", timeout: int = 30) -> ExecutionResult:
         ok, reason = self._docker_available()
@@ -53,76 +93,109 @@ class DockerSandbox(CodeSandbox):
                 meta={"runtime": "docker", "timed_out": False, "truncated": False},
             )
 
-        # Lazy imports only after availability confirmed
-        import docker  # type: ignore
-
         image = os.getenv("DOCKER_IMAGE", "python:3.11-slim")
         network_enabled = os.getenv("DOCKER_NETWORK_ENABLED", "false").lower() == "true"
         cpu_limit = os.getenv("DOCKER_CPU_LIMIT", "0.5")
         mem_limit = os.getenv("DOCKER_MEMORY_LIMIT", "256m")
-
-        client = docker.from_env()
-
-        # Prepare a temp script file, then mount/run inside container
-        with tempfile.TemporaryDirectory(prefix="ag_sbx_dk_") as tmpdir:
-            script_path = os.path.join(tmpdir, "main.py")
-            with open(script_path, "w", encoding="utf-8") as f:
-                f.write(code)
-
-            mounts = {tmpdir: {"bind": "/work", "mode": "ro"}}
-
-            command = ["python", "/work/main.py"]
+        max_output_kb = int(os.getenv("SANDBOX_MAX_OUTPUT_KB", "10"))
+        max_bytes = max_output_kb * 1024
+
+        client = self._get_client()
+
+        with ExitStack() as stack:
+            # Same cwd either way, so relative paths resolve alike; Docker
+            # creates the directory when nothing is mounted there
+            run_kwargs: Dict[str, Any] = {"working_dir": "/work"}
+            if len(code.encode("utf-8")) < INLINE_CODE_MAX_BYTES and "\0" not in code:
+                # Short snippets skip the temp dir, file write and bind mount
+                command = ["python", "-c", code]
+            else:
+                # Prepare a temp script file, then mount/run inside container
+                tmpdir = stack.enter_context(tempfile.TemporaryDirectory(prefix="ag_sbx_dk_"))
+                script_path = os.path.join(tmpdir, "main.py")
+                with open(script_path, "w", encoding="utf-8") as f:
+                    f.write(code)
+
+                run_kwargs["volumes"] = {tmpdir: {"bind": "/work", "mode": "ro"}}
+                command = ["python", "/work/main.py"]
 
             try:
-                container = client.containers.run(
+                # Create, attach, then start, so a snippet that exits at once
+                # cannot finish (or be auto-removed) before its output is
+                # captured; the container is removed when this block exits
+                container = client.containers.create(
                     image=image,
                     command=command,
-                    volumes=mounts,
                     network_disabled=(not network_enabled),
                     mem_limit=mem_limit,
                     nano_cpus=int(float(cpu_limit) * 1e9),  # approximate CPU limit
-                    detach=True,
-                    stdout=True,
-                    stderr=True,
-                    working_dir="/work",
-                    remove=True,
+                    **run_kwargs,
                 )
+                stack.callback(self._remove, container)
+
+                # Single demultiplexed stream yielding (stdout, stderr) frames
+                frames = container.attach(stdout=True, stderr=True, stream=True, demux=True)
+                container.start()
+
+                # timeout enforcement: kill the container, which ends the stream
+                timed_out = threading.Event()
+
+                def _on_timeout() -> None:
+                    timed_out.set()
+                    self._kill(container)
+
+                killer = threading.Timer(timeout, _on_timeout)
+                killer.daemon = True
+                killer.start()
 
+                # Past the output cap, frames are still drained but dropped so
+                # the container runs to its end
+                out_buf = bytearray()
+                err_buf = bytearray()
+                truncated = False
                 try:
-                    exit_code = container.wait(timeout=timeout)["StatusCode"]
-                except Exception:
-                    # timeout enforcement: kill the container
-                    try:
-                        container.kill()
-                    except Exception:
-                        # Best-effort cleanup: ignore errors if the container is already
-                        # stopped, missing, or cannot be killed. The timeout result below
-                        # is returned to the caller regardless of kill() success.
-                        pass
+                    for frame in frames:
+                        for buf, chunk in zip((out_buf, err_buf), frame):
+                            if not chunk:
+                                continue
+                            room = max_bytes + 1 - len(buf) if max_bytes > 0 else len(chunk)
+                            if room < len(chunk):
+                                truncated = True
+                            if room > 0:
+                                buf.extend(chunk[:room])
+                    # The stream ends with the container, so this returns at
+                    # once; a timeout that hits meanwhile still kills it
+                    exit_code = container.wait()["StatusCode"]
+                finally:
+                    killer.cancel()
+
+                out, trunc_out = _truncate_output(out_buf.decode("utf-8", errors="ignore"), max_bytes)
+                err, trunc_err = _truncate_output(err_buf.decode("utf-8", errors="ignore"), max_bytes)
+                truncated = bool(truncated or trunc_out or trunc_err)
+
+                if timed_out.is_set():
+                    note = f"Execution timed out after {timeout}s"
                     return ExecutionResult(
-                        stdout="",
-                        stderr=f"Execution timed out after {timeout}s",
+                        stdout=out,
+                        stderr=f"{err}\n{note}" if err else note,
                         exit_code=-1,
                         duration=time.time() - start,
                         meta={
                             "runtime": "docker",
                             "timed_out": True,
-                            "truncated": False,
+                            "truncated": truncated,
                         },
                     )
 
-                logs = container.logs(stdout=True, stderr=True)
-                out = logs.decode("utf-8", errors="ignore")
-                # Split rough stdout/stderr is non-trivial; return all in stdout for now
                 return ExecutionResult(
                     stdout=out,
-                    stderr="",
+                    stderr=err,
                     exit_code=int(exit_code),
                     duration=time.time() - start,
                     meta={
                         "runtime": "docker",
                         "timed_out": False,
-                        "truncated": False,
+                        "truncated": truncated,
                     },
                 )
             except Exception as exc:
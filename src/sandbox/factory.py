@@ -1,13 +1,18 @@
+import functools
 import os
 from .base import CodeSandbox
 from .local import LocalSandbox
 
 
+@functools.lru_cache(maxsize=1)
 def get_sandbox() -> CodeSandbox:
     """Factory method to obtain the configured executor.
 
-    Supported types: local (default), docker (opt-in), e2b (future)
+    Supported types: local (default), docker (opt-in), inproc (opt-in,
+    trusted code only), e2b (future)
     Falls back to local if the requested type module is unavailable.
+    The executor is resolved once per process; call reset_sandbox() after
+    changing SANDBOX_TYPE.
     """
     mode = os.getenv("SANDBOX_TYPE", "local").lower()
 
@@ -20,6 +25,11 @@ def get_sandbox() -> CodeSandbox:
             # If DockerSandbox module can't be imported, fallback to local
             return LocalSandbox()
 
+    if mode == "inproc":
+        from .inproc import InProcessSandbox
+
+        return InProcessSandbox()
+
     if mode == "e2b":
         try:
             from .e2b_exec import E2BSandbox  # type: ignore
@@ -29,3 +39,8 @@ def get_sandbox() -> CodeSandbox:
             return LocalSandbox()
 
     return LocalSandbox()
+
+
+def reset_sandbox() -> None:
+    """Forget the cached executor so the next get_sandbox() re-reads SANDBOX_TYPE."""
+    get_sandbox.cache_clear()
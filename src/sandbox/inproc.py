@@ -0,0 +1,224 @@
+import ast
+import builtins
+import functools
+import importlib
+import io
+import signal
+import threading
+import time
+import traceback
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
+
+from .base import CodeSandbox, ExecutionResult
+from .local import LocalSandbox, _max_output_kb, _truncate_output
+
+# Statements and expressions a snippet may use; anything else (def, class,
+# try, with, del, global, async, ...) sends it to LocalSandbox instead
+_ALLOWED_NODES = (
+    ast.Module, ast.Expr, ast.Assign, ast.AugAssign, ast.AnnAssign, ast.NamedExpr,
+    ast.If, ast.For, ast.While, ast.Break, ast.Continue, ast.Pass,
+    ast.Assert, ast.Raise, ast.Import, ast.ImportFrom, ast.alias,
+    ast.Name, ast.Attribute, ast.Constant, ast.Call, ast.keyword, ast.Starred,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp,
+    ast.List, ast.Tuple, ast.Set, ast.Dict, ast.Subscript, ast.Slice,
+    ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp, ast.comprehension,
+    ast.JoinedStr, ast.FormattedValue,
+    ast.expr_context, ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+)
+
+# Modules of plain functions, without public references to other modules,
+# mutable global state or helpers that reach attributes by name at runtime
+# (string.Formatter.get_field, functools.update_wrapper, ...)
+_ALLOWED_MODULES = frozenset({"math", "cmath", "itertools", "heapq", "bisect"})
+
+# str.format and friends resolve attribute paths at runtime, past the AST
+# check; generator and frame attributes lead to the host's frames and globals
+_BLOCKED_ATTRS = frozenset({
+    "format", "format_map", "vformat", "get_field", "get_value",
+    "gi_frame", "gi_code", "cr_frame", "cr_code", "ag_frame", "ag_code",
+    "f_back", "f_globals", "f_locals", "f_builtins", "f_code", "tb_frame", "tb_next",
+})
+
+_SAFE_BUILTIN_NAMES = (
+    "abs", "all", "any", "ascii", "bin", "bool", "bytes", "callable", "chr",
+    "complex", "dict", "divmod", "enumerate", "filter", "float", "format",
+    "frozenset", "hash", "hex", "int", "isinstance", "issubclass", "iter",
+    "len", "list", "map", "max", "min", "next", "oct", "ord", "pow", "range",
+    "repr", "reversed", "round", "set", "slice", "sorted", "str", "sum",
+    "tuple", "zip",
+    "ArithmeticError", "AssertionError", "Exception", "IndexError", "KeyError",
+    "OverflowError", "StopIteration", "TypeError", "ValueError", "ZeroDivisionError",
+)
+
+# Builtins a snippet may not name; using one needs the real interpreter
+_UNSAFE_BUILTIN_NAMES = frozenset(dir(builtins)) - set(_SAFE_BUILTIN_NAMES) - {"print"}
+
+
+class _JobTimeout(BaseException):
+    """Raised out of a job by SIGALRM once its timeout passes."""
+
+
+class _CappedBuffer(io.StringIO):
+    """Keeps the first ``cap`` characters written (0 means no cap) and drops the rest."""
+
+    def __init__(self, cap: int) -> None:
+        super().__init__()
+        self._cap = cap
+        self._size = 0
+        self.capped = False
+
+    def write(self, s: str) -> int:
+        room = self._cap - self._size if self._cap else len(s)
+        if room < len(s):
+            self.capped = True
+        if room > 0:
+            self._size += super().write(s[:room])
+        return len(s)
+
+
+def _check_node(node: ast.AST) -> None:
+    if not isinstance(node, _ALLOWED_NODES):
+        raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+    if isinstance(node, ast.Name):
+        if node.id.startswith("__") or node.id in _UNSAFE_BUILTIN_NAMES:
+            raise ValueError(f"Name not allowed: {node.id}")
+    elif isinstance(node, ast.Attribute):
+        if node.attr.startswith("_") or node.attr in _BLOCKED_ATTRS:
+            raise ValueError(f"Attribute not allowed: {node.attr}")
+        if not isinstance(node.ctx, ast.Load):
+            # Modules are shared with the host, so never assign through them
+            raise ValueError("Attribute assignment not allowed")
+    elif isinstance(node, ast.Import):
+        for alias in node.names:
+            if alias.name not in _ALLOWED_MODULES:
+                raise ValueError(f"Module not allowed: {alias.name}")
+    elif isinstance(node, ast.ImportFrom):
+        if node.level or node.module not in _ALLOWED_MODULES:
+            raise ValueError(f"Module not allowed: {node.module}")
+        for alias in node.names:
+            if alias.name == "*" or alias.name.startswith("_"):
+                raise ValueError(f"Import not allowed: {alias.name}")
+    elif isinstance(node, ast.alias):
+        if (alias_name := node.asname or node.name).startswith("__"):
+            raise ValueError(f"Name not allowed: {alias_name}")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_checked(code: str) -> Optional[CodeType]:
+    """Parse, vet and compile a snippet once; None if it must run out of process."""
+    try:
+        tree = ast.parse(code, filename="<sandbox>", mode="exec")
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            _check_node(node)
+            stack.extend(ast.iter_child_nodes(node))
+        return compile(tree, "<sandbox>", "exec")
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        # Deeply nested input can exhaust the parser or compiler; the real
+        # interpreter reports that as an ordinary failed run
+        return None
+
+
+def _restricted_import(name: str, globals=None, locals=None, fromlist=(), level=0) -> Any:
+    if level or name not in _ALLOWED_MODULES:
+        raise ImportError(f"Module not allowed: {name}")
+    return importlib.import_module(name)
+
+
+def _run_inline(code: CodeType, timeout: int, cap: int) -> Tuple[str, str, int, bool, bool]:
+    out = _CappedBuffer(cap)
+    err = io.StringIO()
+
+    def _print(
+        *args: Any, sep: Optional[str] = " ", end: Optional[str] = "\n", file: Any = None, flush: bool = False
+    ) -> None:
+        builtins.print(*args, sep=sep, end=end, file=out if file is None else file)
+
+    safe_builtins: Dict[str, Any] = {name: getattr(builtins, name) for name in _SAFE_BUILTIN_NAMES}
+    safe_builtins["print"] = _print
+    safe_builtins["__import__"] = _restricted_import
+    namespace = {"__builtins__": safe_builtins, "__name__": "__main__"}
+
+    def _on_alarm(signum: int, frame: Any) -> None:
+        raise _JobTimeout
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    try:
+        # Disarm before any handler runs, so the alarm can only fire inside
+        # this block and is always caught below
+        try:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+            exec(code, namespace)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except _JobTimeout:
+        return "", f"Execution timed out after {timeout}s", -1, True, False
+    except Exception as exc:
+        # Drop this frame so the traceback starts at the snippet
+        traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next, file=err)
+        return out.getvalue(), err.getvalue(), 1, False, out.capped
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+    return out.getvalue(), "", 0, False, out.capped
+
+
+class InProcessSandbox(CodeSandbox):
+    """Runs simple snippets with ``exec`` in the agent's own process.
+
+    Intended for trusted, agent-generated code: arithmetic, string handling
+    and the pure stdlib modules in ``_ALLOWED_MODULES``. Each snippet is
+    AST-checked against a whitelist first; anything outside it (other
+    imports, function or class definitions, dunder or unknown builtins,
+    file access, ...) runs on :class:`LocalSandbox` instead, as does every
+    call made off the main thread or where SIGALRM is unavailable, since the
+    timeout relies on it. This is a latency shortcut, not an isolation
+    boundary: memory use is not limited, and a single long-running builtin
+    call (say ``sum(range(10**12))``) only sees the timeout once it returns.
+    """
+
+    def __init__(self) -> None:
+        self._fallback = LocalSandbox()
+
+    def execute(self, code: str, language: str = "python", timeout: int = 30) -> ExecutionResult:
+        if (
+            language.lower() != "python"
+            or timeout <= 0
+            or not hasattr(signal, "SIGALRM")
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            return self._fallback.execute(code, language=language, timeout=timeout)
+
+        compiled = _compile_checked(code)
+        if compiled is None:
+            return self._fallback.execute(code, language=language, timeout=timeout)
+
+        max_output_kb = _max_output_kb()
+        max_bytes = max_output_kb * 1024
+
+        start = time.time()
+        # Keep some slack over the limit so truncation is still marked
+        stdout, stderr, exit_code, timed_out, capped = _run_inline(
+            compiled, timeout, max_bytes * 2 if max_bytes > 0 else 0
+        )
+        duration = time.time() - start
+
+        stdout, trunc_out = _truncate_output(stdout, max_bytes)
+        stderr, trunc_err = _truncate_output(stderr, max_bytes)
+
+        return ExecutionResult(
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=exit_code,
+            duration=duration,
+            meta={
+                "runtime": "inproc",
+                "truncated": bool(trunc_out or trunc_err or capped),
+                "timed_out": timed_out,
+                "resource_limits": {
+                    "timeout_sec": timeout,
+                    "max_output_kb": max_output_kb,
+                },
+            },
+        )
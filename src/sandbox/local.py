@@ -1,28 +1,135 @@
+import atexit
+import functools
 import os
+import shutil
+import signal
 import sys
 import time
 import tempfile
 import subprocess
-from typing import Tuple
+import threading
+from typing import IO, List, Optional, Tuple
 
 from .base import CodeSandbox, ExecutionResult
+from .pool import WorkerPool, get_pool
+
+# Resolved once per process: changing these env vars needs a restart
+_PY_EXE = sys.executable
+
+
+@functools.lru_cache(maxsize=1)
+def _max_output_kb() -> int:
+    return int(os.getenv("SANDBOX_MAX_OUTPUT_KB", "10"))
+
+
+@functools.lru_cache(maxsize=1)
+def _use_tempdir() -> bool:
+    return os.getenv("SANDBOX_USE_TEMPDIR", "false").lower() == "true"
 
 
 def _truncate_output(text: str, max_bytes: int) -> Tuple[str, bool]:
-    if max_bytes <= 0:
+    # UTF-8 takes 1-4 bytes per code point, so len(text) bounds the encoded
+    # size from both sides and most outputs never need encoding at all
+    if max_bytes <= 0 or len(text) * 4 <= max_bytes:
         return text, False
-    encoded = text.encode("utf-8", errors="ignore")
-    if len(encoded) <= max_bytes:
+    if len(text) <= max_bytes and len(text.encode("utf-8", errors="ignore")) <= max_bytes:
         return text, False
-    truncated = encoded[: max_bytes - 32].decode("utf-8", errors="ignore")
+    # Only the head survives, so encode just that many code points
+    keep = max_bytes - 32
+    truncated = text[:keep].encode("utf-8", errors="ignore")[:keep].decode("utf-8", errors="ignore")
     return truncated + "\n... (output truncated)", True
 
 
+# Start each fallback job as its own process group so it can be killed
+# together with anything it spawned
+if os.name == "posix":
+    _NEW_GROUP = {"start_new_session": True}
+else:
+    _NEW_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Kill a job started with _NEW_GROUP and every process it spawned."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+    except OSError:
+        pass
+    proc.kill()
+
+
+def _drain(pipe: IO[bytes], buf: bytearray, cap: int, over: threading.Event) -> None:
+    # Runs in a reader thread: pipes have no portable non-blocking read.
+    # Output past the cap is still read, then dropped, so the child never
+    # stalls on a full pipe and memory stays bounded
+    with pipe:
+        for chunk in iter(lambda: pipe.read1(65536), b""):
+            room = cap - len(buf) if cap else len(chunk)
+            if room < len(chunk):
+                over.set()
+            if room > 0:
+                buf += chunk[:room]
+
+
+def _read_capped(proc: subprocess.Popen, timeout: float, cap: int) -> Tuple[bytes, bytes, bool, bool]:
+    """Collect a child's stdout/stderr, killing it on timeout. At most ``cap``
+    bytes (0 means no cap) of each stream are kept; the rest is discarded.
+
+    Returns:
+        (stdout, stderr, timed_out, capped)
+    """
+    bufs = (bytearray(), bytearray())
+    over = threading.Event()
+    readers = [
+        threading.Thread(target=_drain, args=(pipe, buf, cap, over), daemon=True)
+        for pipe, buf in zip((proc.stdout, proc.stderr), bufs)
+    ]
+    for reader in readers:
+        reader.start()
+
+    # Both readers end at EOF, so joining them shares one deadline
+    deadline = time.monotonic() + timeout
+    for reader in readers:
+        reader.join(max(deadline - time.monotonic(), 0))
+    timed_out = any(reader.is_alive() for reader in readers)
+
+    if not timed_out:
+        # Pipes can close before the process exits; keep the deadline
+        try:
+            proc.wait(max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            timed_out = True
+
+    if timed_out:
+        _kill_tree(proc)
+    proc.wait()
+    for reader in readers:
+        reader.join(1.0)
+    return bytes(bufs[0]), bytes(bufs[1]), timed_out, over.is_set()
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_workdir() -> str:
+    """One scratch directory reused by every job that skips its own temp dir."""
+    path = tempfile.mkdtemp(prefix="ag_sandbox_")
+    atexit.register(shutil.rmtree, path, True)
+    return path
+
+
 class LocalSandbox(CodeSandbox):
     """Local subprocess-based sandbox.
 
-    Runs code using the current Python interpreter inside an isolated temp directory.
-    Applies timeout and output truncation.
+    Runs code using the current Python interpreter, fed through stdin with a
+    shared scratch directory as cwd. Set SANDBOX_USE_TEMPDIR=true to give each
+    job its own temp directory (and a main.py) instead. Applies timeout and
+    output truncation. Where fork() is available, jobs run on pre-warmed
+    workers from :mod:`.pool` instead of a fresh interpreter.
     """
 
     def execute(self, code: str, language: str = "python", timeout: int = 30) -> ExecutionResult:
@@ -35,38 +142,21 @@ class LocalSandbox(CodeSandbox):
                 meta={"runtime": "local", "truncated": False, "timed_out": False},
             )
 
-        max_output_kb = int(os.getenv("SANDBOX_MAX_OUTPUT_KB", "10"))
+        max_output_kb = _max_output_kb()
         max_bytes = max_output_kb * 1024
 
-        start = time.time()
-        timed_out = False
-        stdout = ""
-        stderr = ""
-        exit_code = 0
+        workdir = None if _use_tempdir() else _shared_workdir()
 
-        with tempfile.TemporaryDirectory(prefix="ag_sandbox_") as tmpdir:
-            script_path = os.path.join(tmpdir, "main.py")
-            with open(script_path, "w", encoding="utf-8") as f:
-                f.write(code)
-
-            try:
-                proc = subprocess.run(
-                    [sys.executable, script_path],
-                    cwd=tmpdir,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
-                stdout = proc.stdout or ""
-                stderr = proc.stderr or ""
-                exit_code = proc.returncode
-            except subprocess.TimeoutExpired:
-                timed_out = True
-                exit_code = -1
-                stderr = f"Execution timed out after {timeout}s"
-            except Exception as exc:
-                exit_code = 1
-                stderr = f"Unexpected execution error: {exc}"
+        start = time.time()
+        pool = get_pool()
+        if pool is not None:
+            stdout, stderr, exit_code, timed_out, capped = self._run_pooled(
+                pool, code, timeout, workdir, max_bytes
+            )
+        else:
+            stdout, stderr, exit_code, timed_out, capped = self._run_subprocess(
+                code, timeout, workdir, max_bytes
+            )
 
         duration = time.time() - start
 
@@ -80,7 +170,7 @@ class LocalSandbox(CodeSandbox):
             duration=duration,
             meta={
                 "runtime": "local",
-                "truncated": bool(trunc_out or trunc_err),
+                "truncated": bool(trunc_out or trunc_err or capped),
                 "timed_out": timed_out,
                 "resource_limits": {
                     "timeout_sec": timeout,
@@ -88,3 +178,74 @@ class LocalSandbox(CodeSandbox):
                 },
             },
         )
+
+    @staticmethod
+    def _run_pooled(
+        pool: WorkerPool, code: str, timeout: int, workdir: Optional[str], max_bytes: int
+    ) -> Tuple[str, str, int, bool, bool]:
+        try:
+            reply = pool.run(code, timeout, workdir, max_bytes)
+        except TimeoutError:
+            return "", f"Execution timed out after {timeout}s", -1, True, False
+        except Exception as exc:
+            return "", f"Unexpected execution error: {exc}", 1, False, False
+        if reply["timed_out"]:
+            return "", f"Execution timed out after {timeout}s", -1, True, False
+        return reply["stdout"], reply["stderr"], reply["exit_code"], False, reply["truncated"]
+
+    @staticmethod
+    def _run_subprocess(
+        code: str, timeout: int, workdir: Optional[str], max_bytes: int
+    ) -> Tuple[str, str, int, bool, bool]:
+        if workdir is not None:
+            return LocalSandbox._communicate([_PY_EXE, "-"], code, workdir, timeout, max_bytes)
+
+        with tempfile.TemporaryDirectory(prefix="ag_sandbox_") as tmpdir:
+            script_path = os.path.join(tmpdir, "main.py")
+            with open(script_path, "w", encoding="utf-8") as f:
+                f.write(code)
+            return LocalSandbox._communicate(
+                [_PY_EXE, script_path], None, tmpdir, timeout, max_bytes
+            )
+
+    @staticmethod
+    def _communicate(
+        args: List[str], stdin: Optional[str], cwd: str, timeout: int, max_bytes: int
+    ) -> Tuple[str, str, int, bool, bool]:
+        try:
+            proc = subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL if stdin is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                **_NEW_GROUP,
+            )
+        except Exception as exc:
+            return "", f"Unexpected execution error: {exc}", 1, False, False
+
+        try:
+            if stdin is not None:
+                with proc.stdin:
+                    proc.stdin.write(stdin.encode("utf-8"))
+            # Keep some slack over the limit so truncation is still marked
+            cap = max_bytes * 2 if max_bytes > 0 else 0
+            out, err, timed_out, capped = _read_capped(proc, timeout, cap)
+        except BaseException as exc:
+            # Its own session no longer sees the terminal's Ctrl-C, so never
+            # leave the job behind, not even on KeyboardInterrupt
+            _kill_tree(proc)
+            proc.wait()
+            if not isinstance(exc, Exception):
+                raise
+            return "", f"Unexpected execution error: {exc}", 1, False, False
+
+        if timed_out:
+            return "", f"Execution timed out after {timeout}s", -1, True, False
+        return (
+            out.decode("utf-8", errors="replace"),
+            err.decode("utf-8", errors="replace"),
+            proc.returncode,
+            False,
+            capped,
+        )
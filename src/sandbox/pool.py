@@ -0,0 +1,165 @@
+import atexit
+import json
+import os
+import queue
+import selectors
+import signal
+import struct
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_worker.py")
+_HEADER = struct.Struct(">I")
+
+# Workers enforce the job timeout themselves; the parent only gives up on a
+# worker that has not replied this long after it
+_REPLY_GRACE_SEC = 5.0
+
+
+class _Worker:
+    """One pre-started ``_worker.py`` process and its protocol pipes."""
+
+    __slots__ = ("proc", "_selector")
+
+    def __init__(self) -> None:
+        # Own session so a timeout can kill the worker and its job together
+        self.proc = subprocess.Popen(
+            [sys.executable, _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            start_new_session=True,
+        )
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.proc.stdout, selectors.EVENT_READ)
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def run(
+        self, code: str, timeout: float, cwd: Optional[str], max_bytes: int
+    ) -> Dict[str, Any]:
+        """Send one job and wait for its reply.
+
+        ``cwd`` is the directory the job runs in; None gives the job a
+        private temp dir instead. The worker kills the job once ``timeout``
+        passes, and keeps only about twice ``max_bytes`` of its stdout and
+        stderr (0 disables the cap), flagging dropped output in the reply.
+
+        Raises:
+            TimeoutError: The worker itself did not reply in time.
+            EOFError: The worker exited before replying.
+        """
+        request = {"code": code, "cwd": cwd, "timeout": timeout, "max_bytes": max_bytes}
+        data = json.dumps(request).encode("utf-8")
+        view = memoryview(_HEADER.pack(len(data)) + data)
+        while view:
+            view = view[self.proc.stdin.write(view):]
+
+        deadline = time.monotonic() + timeout + _REPLY_GRACE_SEC
+        (size,) = _HEADER.unpack(self._read_exact(_HEADER.size, deadline))
+        return json.loads(self._read_exact(size, deadline))
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        fd = self.proc.stdout.fileno()
+        chunks = []
+        while size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                raise TimeoutError
+            chunk = os.read(fd, min(size, 1 << 20))
+            if not chunk:
+                raise EOFError("sandbox worker exited")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def kill(self) -> None:
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        self.proc.wait()
+        self._selector.close()
+        self.proc.stdin.close()
+        self.proc.stdout.close()
+
+
+class WorkerPool:
+    """Pre-warmed Python workers shared by every LocalSandbox.
+
+    ``size`` workers are kept idle and ready; a burst beyond that starts
+    extra workers that are discarded afterwards. A worker whose job times
+    out or crashes is killed and replaced straight away.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for _ in range(size):
+            self._idle.put(_Worker())
+
+    def run(
+        self, code: str, timeout: float, cwd: Optional[str] = None, max_bytes: int = 0
+    ) -> Dict[str, Any]:
+        """Run ``code`` on an idle worker; see :meth:`_Worker.run`."""
+        worker = self._acquire()
+        try:
+            result = worker.run(code, timeout, cwd, max_bytes)
+        except BaseException:
+            worker.kill()
+            self._refill()
+            raise
+        if self._idle.qsize() < self.size:
+            self._idle.put(worker)
+        else:
+            worker.kill()
+        return result
+
+    def _acquire(self) -> _Worker:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return _Worker()
+            if worker.alive():
+                return worker
+            worker.kill()
+
+    def _refill(self) -> None:
+        if self._idle.qsize() < self.size:
+            self._idle.put(_Worker())
+
+    def close(self) -> None:
+        """Stop every idle worker."""
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+_POOL: Optional[WorkerPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> Optional[WorkerPool]:
+    """Return the process-wide worker pool, or None where fork() is unavailable.
+
+    Workers inherit the environment at the time the pool starts, and
+    SANDBOX_POOL_SIZE (default 2) is read only then.
+    """
+    global _POOL
+    if not hasattr(os, "fork"):
+        return None
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                pool = WorkerPool(max(1, int(os.getenv("SANDBOX_POOL_SIZE", "2"))))
+                atexit.register(pool.close)
+                _POOL = pool
+    return _POOL
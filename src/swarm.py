@@ -73,28 +73,34 @@ class SwarmOrchestrator:
     facilitating task delegation, execution, and result synthesis.
     """
     
-    def __init__(self):
-        """Initialize the swarm with router and worker agents."""
-        print("🪐 Initializing Antigravity Swarm...")
+    def __init__(self, verbose: bool = True):
+        """
+        Initialize the swarm with router and worker agents.
+        
+        Args:
+            verbose: Whether to print initialization progress.
+        """
+        log = print if verbose else (lambda *args: None)
+        log("🪐 Initializing Antigravity Swarm...")
         
         # Initialize message bus
         self.message_bus = MessageBus()
         
         # Initialize router
-        print("   🧭 Creating Router agent...")
+        log("   🧭 Creating Router agent...")
         self.router = RouterAgent()
         
         # Initialize worker agents
-        print("   💻 Creating Coder agent...")
-        print("   🔍 Creating Reviewer agent...")
-        print("   📚 Creating Researcher agent...")
+        log("   💻 Creating Coder agent...")
+        log("   🔍 Creating Reviewer agent...")
+        log("   📚 Creating Researcher agent...")
         self.workers = {
             "coder": CoderAgent(),
             "reviewer": ReviewerAgent(),
             "researcher": ResearcherAgent()
         }
         
-        print(f"✅ Swarm initialized with {len(self.workers)} specialist agents!\n")
+        log(f"✅ Swarm initialized with {len(self.workers)} specialist agents!\n")
     
     def execute(self, user_task: str, verbose: bool = True) -> str:
         """
@@ -122,8 +128,8 @@ class SwarmOrchestrator:
             for i, delegation in enumerate(delegations, 1):
                 print(f"      {i}. {delegation['agent']} → {delegation['task']}")
         
-        # Step 2: Execute delegations
-        results = []
+        # Step 2: Dispatch delegations
+        contexts = []
         for i, delegation in enumerate(delegations, 1):
             agent_name = delegation['agent']
             agent_task = delegation['task']
@@ -136,23 +142,20 @@ class SwarmOrchestrator:
             # Record delegation in message bus
             self.message_bus.send("router", agent_name, "task", agent_task)
             
-            # Get worker agent
-            worker = self.workers.get(agent_name)
-            if not worker:
-                result = f"Error: Unknown agent '{agent_name}'"
-                results.append(result)
+            # Snapshot the worker's context as of its own delegation
+            contexts.append(self.message_bus.get_context_for(agent_name))
+        
+        # Execute all delegations concurrently; results keep plan order
+        if verbose:
+            print(f"\n🔧 Executing {len(delegations)} task(s) in parallel...")
+        
+        results = self.router.run_delegations(delegations, self.workers, contexts)
+        
+        for delegation, result in zip(delegations, results):
+            agent_name = delegation['agent']
+            if agent_name not in self.workers:
                 continue
             
-            # Get context for the worker
-            context = self.message_bus.get_context_for(agent_name)
-            
-            # Execute task
-            if verbose:
-                print(f"\n🔧 [{agent_name.capitalize()}] Executing task...")
-            
-            result = worker.execute(agent_task, context)
-            results.append(result)
-            
             # Record result in message bus
             self.message_bus.send(agent_name, "router", "result", result)
             
@@ -165,7 +168,7 @@ class SwarmOrchestrator:
             print(f"\n{'=' * 70}")
             print("\n🧭 [Router] Synthesizing final results...")
         
-        final_result = self.router.synthesize_results(delegations, results)
+        final_result = self.router.synthesize_results(delegations, results, stream=verbose)
         
         if verbose:
             print("\n" + "=" * 70)
@@ -7,9 +7,68 @@ Usage:
     python -m src.swarm_demo
 """
 
+import asyncio
+import threading
+from typing import Optional, Tuple
+
 from src.swarm import SwarmOrchestrator
 
 
+async def _ainput(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    Uses a daemon thread rather than the loop's executor so that Ctrl+C does
+    not wait on the pending read at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def settle(line: Optional[str], error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+    
+    def read() -> None:
+        try:
+            line, error = input(prompt), None
+        except BaseException as e:
+            line, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, line, error)
+        except RuntimeError:
+            pass  # Loop already closed
+    
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def _prepare(num_demos: int) -> Tuple[SwarmOrchestrator, str, str]:
+    """
+    Ask for the demo to run while the swarm is built in the background.
+    
+    Creating the agents (and the Gemini client behind them) takes a moment,
+    so it overlaps with the user reading the menu.
+    
+    Returns:
+        The ready swarm, the menu choice and the custom task (empty unless
+        the choice is 0).
+    """
+    swarm_task = asyncio.ensure_future(asyncio.to_thread(SwarmOrchestrator, verbose=False))
+    
+    choice = (await _ainput(f"Select demo (0-{num_demos + 1}): ")).strip()
+    custom_task = ""
+    if choice == "0":
+        custom_task = (await _ainput("\nEnter your task: ")).strip()
+    
+    swarm = await swarm_task
+    print(f"✅ Swarm initialized with {len(swarm.workers)} specialist agents!")
+    return swarm, choice, custom_task
+
+
 def main():
     """Run swarm demonstration with example tasks."""
     
@@ -17,9 +76,6 @@ def main():
     print("║         🪐 Antigravity Multi-Agent Swarm Demonstration            ║")
     print("╚════════════════════════════════════════════════════════════════════╝\n")
     
-    # Initialize the swarm
-    swarm = SwarmOrchestrator()
-    
     # Demo tasks
     demo_tasks = [
         {
@@ -48,11 +104,10 @@ def main():
     print("0. Enter custom task\n")
     
     try:
-        choice = input("Select demo (0-5): ").strip()
+        swarm, choice, custom_task = asyncio.run(_prepare(len(demo_tasks)))
         
         if choice == "0":
             # Custom task
-            custom_task = input("\nEnter your task: ").strip()
             if custom_task:
                 print("\n" + "=" * 70)
                 result = swarm.execute(custom_task, verbose=True)
@@ -3,6 +3,18 @@ Tools package for Antigravity Agent.
 
 All Python files in this directory are automatically discovered and loaded.
 Any public function (not starting with _) will be registered as an available tool.
+Coroutine and generator functions (e.g. ``acall_openai_chat`` or
+``call_openai_chat_stream``) are library helpers and are not registered, since
+the agent invokes tools synchronously and expects a plain return value.
+
+Registration is driven by ``_manifest.py`` (generated by
+``scripts/build_tool_manifest.py``). The manifest records each module's mtime
+and size; if it is missing or any tool module was added, removed or edited
+since (a fresh checkout counts), the package falls back to scanning every
+module, so new and changed tools still work; re-run the script to refresh it. The
+result of such a scan is remembered in ``~/.cache/antigravity/tools_index.json``
+keyed on each module's mtime and size, so later startups skip the scan until
+a tool file changes.
 
 Tool Requirements:
 - Must have type hints for all parameters
@@ -22,3 +34,218 @@ Example tool structure:
         # Implementation here
         return result
 """
+
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+# Registry of every public tool function, populated once at package import.
+# Python caches the submodules in sys.modules, so later lookups are free.
+TOOLS: Dict[str, Callable[..., Any]] = {}
+
+_INDEX_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "antigravity",
+    "tools_index.json",
+)
+
+
+def _scan_tool_modules() -> Optional[Dict[str, "os.DirEntry[str]"]]:
+    """Directory entries of the public tool modules, keyed by module name.
+
+    One ``os.scandir`` pass supplies both the file type and, for the scan
+    cache, the stat info. Returns None if the package is not a plain
+    directory (e.g. zipped).
+    """
+    try:
+        with os.scandir(__path__[0]) as it:
+            return {
+                entry.name[:-3]: entry
+                for entry in it
+                if entry.name.endswith(".py")
+                and not entry.name.startswith("_")
+                and entry.is_file()
+            }
+    except OSError:
+        return None
+
+
+def _tool_module_names() -> List[str]:
+    """Names of the public tool modules, for packages :func:`_scan_tool_modules` can't list."""
+    return [
+        module_info.name
+        for module_info in pkgutil.iter_modules(__path__)
+        if not module_info.name.startswith("_")
+    ]
+
+
+def _is_tool_function(obj: Any) -> bool:
+    """Plain functions only; async and generator helpers are not agent tools."""
+    return (
+        inspect.isfunction(obj)
+        and not inspect.iscoroutinefunction(obj)
+        and not inspect.isgeneratorfunction(obj)
+    )
+
+
+def _module_fingerprint(entries: Dict[str, "os.DirEntry[str]"]) -> List[List[Any]]:
+    """``[name, mtime_ns, size]`` of each tool module file, in name order."""
+    fingerprint = []
+    for short_name in sorted(entries):
+        st = entries[short_name].stat()
+        fingerprint.append([short_name, st.st_mtime_ns, st.st_size])
+    return fingerprint
+
+
+def _resolve_index(
+    index: Mapping[str, Sequence[str]],
+) -> Optional[Dict[str, Callable[..., Any]]]:
+    """Import the modules named in a ``{tool: (module, attr)}`` index.
+
+    Returns:
+        Dictionary mapping tool names to callables, or None if the index
+        names a function that no longer exists.
+    """
+    tools: Dict[str, Callable[..., Any]] = {}
+    failed_modules = set()
+
+    for name, (module_name, attr) in index.items():
+        if module_name in failed_modules:
+            continue
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            print(f"   ⚠️ Failed to load tools from {module_name.rsplit('.', 1)[-1]}.py: {e}")
+            failed_modules.add(module_name)
+            continue
+
+        fn = getattr(module, attr, None)
+        if not _is_tool_function(fn):
+            # A tool was renamed or removed since the index was built
+            return None
+        tools[name] = fn
+
+    return tools
+
+
+def _load_from_manifest(
+    module_names: List[str], fingerprint: Optional[List[List[Any]]]
+) -> Optional[Dict[str, Callable[..., Any]]]:
+    """Resolve tools from the generated manifest.
+
+    Args:
+        module_names: Public tool modules found in the package.
+        fingerprint: :func:`_module_fingerprint` of those modules, or None
+            for packages without file stats (e.g. zipped), where only the
+            module names are compared.
+
+    Returns:
+        Dictionary mapping tool names to callables, or None if the manifest
+        is missing or stale and a full scan is needed.
+    """
+    try:
+        from . import _manifest
+    except ImportError:
+        return None
+
+    if sorted(_manifest.MODULES) != sorted(module_names):
+        return None
+    if fingerprint is not None and getattr(_manifest, "FINGERPRINT", None) != fingerprint:
+        return None
+    return _resolve_index(_manifest.TOOLS)
+
+
+def _load_from_cache(fingerprint: List[List[Any]]) -> Optional[Dict[str, Callable[..., Any]]]:
+    """Resolve tools from the index left by an earlier scan, if still current.
+
+    Returns:
+        Dictionary mapping tool names to callables, or None if there is no
+        index for this directory or any tool module changed since it was written.
+    """
+    try:
+        with open(_INDEX_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("dir") != __path__[0]:
+        return None
+    if cached.get("fingerprint") != fingerprint:
+        return None
+    return _resolve_index(cached.get("tools") or {})
+
+
+def _save_to_cache(fingerprint: List[List[Any]], tools: Dict[str, Callable[..., Any]]) -> None:
+    """Record a scan result for :func:`_load_from_cache`; best effort only."""
+    index = {name: (fn.__module__, fn.__name__) for name, fn in tools.items()}
+    payload = {"dir": __path__[0], "fingerprint": fingerprint, "tools": index}
+    tmp_path = f"{_INDEX_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_INDEX_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, _INDEX_PATH)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _discover_tools(module_names: List[str]) -> Dict[str, Callable[..., Any]]:
+    """Import each tool module once and collect its public functions (dev fallback).
+
+    Returns:
+        Dictionary mapping tool names to callable functions.
+    """
+    tools: Dict[str, Callable[..., Any]] = {}
+
+    for short_name in module_names:
+        module_name = f"{__name__}.{short_name}"
+
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            print(f"   ⚠️ Failed to load tools from {short_name}.py: {e}")
+            continue
+
+        # Only register public functions defined in this module
+        for name, obj in inspect.getmembers(module, inspect.isfunction):
+            if not name.startswith("_") and obj.__module__ == module_name and _is_tool_function(obj):
+                tools[name] = obj
+
+    return tools
+
+
+def _load_tools() -> Dict[str, Callable[..., Any]]:
+    """Registry from the manifest, else the scan cache, else a fresh scan."""
+    entries = _scan_tool_modules()
+    if entries is None:
+        # No mtimes to check the manifest or key the scan cache on
+        module_names = _tool_module_names()
+        tools = _load_from_manifest(module_names, None)
+        return tools if tools is not None else _discover_tools(module_names)
+
+    module_names = sorted(entries)
+    try:
+        fingerprint = _module_fingerprint(entries)
+    except OSError:
+        # A module vanished mid-scan; skip the manifest and cache this once
+        return _discover_tools(module_names)
+
+    tools = _load_from_manifest(module_names, fingerprint)
+    if tools is not None:
+        return tools
+    tools = _load_from_cache(fingerprint)
+    if tools is None:
+        tools = _discover_tools(module_names)
+        _save_to_cache(fingerprint, tools)
+    return tools
+
+
+TOOLS.update(_load_tools())
+
+__all__ = ["TOOLS"]
@@ -0,0 +1,85 @@
+"""Shared HTTP plumbing for the tool modules.
+
+A single ``requests.Session`` per process lets every HTTP-backed tool reuse
+pooled TCP/TLS connections instead of paying a new handshake per call. The
+async variants of the tools share an ``httpx.AsyncClient`` the same way, one
+per event loop.
+Both clients already negotiate compressed responses; :func:`gzip_body` is the
+opt-in counterpart for large request bodies.
+
+Both libraries are imported on first use rather than here: together they
+account for most of the tools package's import time, and many runs never
+make an HTTP call.
+"""
+
+import asyncio
+import functools
+import gzip
+import weakref
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# Connections kept open per host; enough for concurrent agents and swarms
+POOL_MAXSIZE = 32
+
+# Smaller request bodies are sent as-is; gzip would save next to nothing
+GZIP_MIN_BYTES = 4096
+
+# httpx pools belong to the event loop they were opened on, so each running
+# loop gets its own client. asyncio has no hook for a loop shutting down, so
+# a client is only closed by aclose_async_client(); one left open is dropped
+# with its loop once that is collected, without a clean close of its sockets
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> "requests.Session":
+    """Return the process-wide pooled ``requests.Session``."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=POOL_MAXSIZE))
+    session.mount("https://", HTTPAdapter(pool_maxsize=POOL_MAXSIZE))
+    return session
+
+
+def gzip_body(body: bytes, headers: Dict[str, str]) -> bytes:
+    """Gzip ``body`` if it is large enough to benefit, marking ``headers`` to match.
+
+    Only for servers that accept ``Content-Encoding: gzip`` request bodies.
+    """
+    if len(body) < GZIP_MIN_BYTES:
+        return body
+    headers["Content-Encoding"] = "gzip"
+    # Level 6 gets close to the best ratio at a fraction of level 9's cost
+    return gzip.compress(body, compresslevel=6)
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """Return the pooled ``httpx.AsyncClient`` for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        import httpx
+
+        client = httpx.AsyncClient(limits=httpx.Limits(max_connections=POOL_MAXSIZE))
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's pooled ``httpx.AsyncClient``, if it has one.
+
+    Await this at the end of the coroutine passed to ``asyncio.run`` (or
+    before closing a hand-managed loop) after using the async tool variants.
+    A later :func:`get_async_client` call on the same loop opens a new client.
+    """
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
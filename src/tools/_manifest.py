@@ -0,0 +1,37 @@
+"""Generated by scripts/build_tool_manifest.py - do not edit by hand."""
+
+MODULES = (
+    "demo_tool",
+    "example_tool",
+    "execution_tool",
+    "mcp_tools",
+    "ollama_local",
+    "openai_proxy",
+)
+
+# [name, mtime_ns, size] per module, as src.tools._module_fingerprint reports
+FINGERPRINT = [
+    ["demo_tool", 1791979413727045686, 897],
+    ["example_tool", 1791980296769565135, 5630],
+    ["execution_tool", 1791980296769565135, 1233],
+    ["mcp_tools", 1791980296769565135, 7776],
+    ["ollama_local", 1791980296769565135, 4975],
+    ["openai_proxy", 1791980296769565135, 6765],
+]
+
+TOOLS = {
+    "greet_user": ("src.tools.demo_tool", "greet_user"),
+    "reverse_text": ("src.tools.demo_tool", "reverse_text"),
+    "calculate_math": ("src.tools.example_tool", "calculate_math"),
+    "get_stock_price": ("src.tools.example_tool", "get_stock_price"),
+    "get_weather": ("src.tools.example_tool", "get_weather"),
+    "send_email": ("src.tools.example_tool", "send_email"),
+    "web_search": ("src.tools.example_tool", "web_search"),
+    "run_python_code": ("src.tools.execution_tool", "run_python_code"),
+    "get_mcp_tool_help": ("src.tools.mcp_tools", "get_mcp_tool_help"),
+    "list_mcp_servers": ("src.tools.mcp_tools", "list_mcp_servers"),
+    "list_mcp_tools": ("src.tools.mcp_tools", "list_mcp_tools"),
+    "mcp_health_check": ("src.tools.mcp_tools", "mcp_health_check"),
+    "call_local_ollama": ("src.tools.ollama_local", "call_local_ollama"),
+    "call_openai_chat": ("src.tools.openai_proxy", "call_openai_chat"),
+}
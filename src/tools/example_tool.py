@@ -1,6 +1,7 @@
-import requests
 import ast
-import operator as _operator
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, Dict, Tuple
 
 
 def web_search(query: str) -> str:
@@ -49,13 +50,69 @@ def get_stock_price(ticker: str) -> float:
     return 150.00 # Mock price
 
 
+# Operators calculate_math accepts; anything else is rejected before compiling
+_ALLOWED_BINOPS = (
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+)
+_ALLOWED_UNARYOPS = (ast.UAdd, ast.USub)
+
+
+def _check_constant(node: ast.Constant) -> Tuple[ast.AST, ...]:
+    if not isinstance(node.value, (int, float)):
+        raise ValueError("Unsupported constant type")
+    return ()
+
+
+def _check_binop(node: ast.BinOp) -> Tuple[ast.AST, ...]:
+    if not isinstance(node.op, _ALLOWED_BINOPS):
+        raise ValueError(f"Unsupported binary operator: {type(node.op)}")
+    return node.left, node.right
+
+
+def _check_unaryop(node: ast.UnaryOp) -> Tuple[ast.AST, ...]:
+    if not isinstance(node.op, _ALLOWED_UNARYOPS):
+        raise ValueError(f"Unsupported unary operator: {type(node.op)}")
+    return (node.operand,)
+
+
+# Node type -> checker returning the children still to visit
+_MATH_CHECKERS: Dict[type, Callable[[Any], Tuple[ast.AST, ...]]] = {
+    ast.Expression: lambda node: (node.body,),
+    ast.Constant: _check_constant,
+    ast.BinOp: _check_binop,
+    ast.UnaryOp: _check_unaryop,
+}
+
+
+def _validate_math_tree(tree: ast.AST) -> None:
+    # Explicit stack instead of recursion: one dict lookup per node and no
+    # frame per nesting level
+    stack = [tree]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        node = pop()
+        checker = _MATH_CHECKERS.get(type(node))
+        if checker is None:
+            raise ValueError(f"Unsupported expression: {type(node)}")
+        extend(checker(node))
+
+
+@lru_cache(maxsize=512)
+def _compile_math(expression: str) -> CodeType:
+    """Parse, whitelist-check and compile an expression; cached by its text."""
+    parsed = ast.parse(expression, mode="eval")
+    _validate_math_tree(parsed)
+    return compile(parsed, "<calc>", "eval")
+
+
 def calculate_math(expression: str) -> float:
     """Safely evaluate a mathematical expression and return the numeric result.
 
     This function parses the expression using Python's AST and permits only a
     restricted set of nodes and operators (binary ops, unary ops, numeric
     literals). It does not execute arbitrary code and therefore is safe for
-    untrusted input compared to `eval`.
+    untrusted input compared to a bare `eval`: only expressions that pass the
+    whitelist are compiled, and the compiled form is cached per expression.
 
     Args:
         expression: A string containing the math expression (e.g. "2 + 3*4").
@@ -66,47 +123,8 @@ def calculate_math(expression: str) -> float:
     Raises:
         ValueError: If the expression contains unsupported nodes or is invalid.
     """
-
-    # Allowed operator mapping
-    operators = {
-        ast.Add: _operator.add,
-        ast.Sub: _operator.sub,
-        ast.Mult: _operator.mul,
-        ast.Div: _operator.truediv,
-        ast.Pow: _operator.pow,
-        ast.Mod: _operator.mod,
-        ast.FloorDiv: _operator.floordiv,
-        ast.UAdd: _operator.pos,
-        ast.USub: _operator.neg,
-    }
-
-    def _eval(node):
-        if isinstance(node, ast.Expression):
-            return _eval(node.body)
-        if isinstance(node, ast.Constant):  # Python 3.8+
-            if isinstance(node.value, (int, float)):
-                return node.value
-            raise ValueError("Unsupported constant type")
-        if isinstance(node, ast.Num):  # older AST
-            return node.n
-        if isinstance(node, ast.BinOp):
-            left = _eval(node.left)
-            right = _eval(node.right)
-            op_type = type(node.op)
-            if op_type in operators:
-                return operators[op_type](left, right)
-            raise ValueError(f"Unsupported binary operator: {op_type}")
-        if isinstance(node, ast.UnaryOp):
-            operand = _eval(node.operand)
-            op_type = type(node.op)
-            if op_type in operators:
-                return operators[op_type](operand)
-            raise ValueError(f"Unsupported unary operator: {op_type}")
-        raise ValueError(f"Unsupported expression: {type(node)}")
-
     try:
-        parsed = ast.parse(expression, mode="eval")
-        result = _eval(parsed)
+        result = eval(_compile_math(expression), {"__builtins__": {}}, {})
         if isinstance(result, (int, float)):
             return float(result)
         raise ValueError(f"Invalid expression result type: {type(result)}")
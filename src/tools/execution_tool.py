@@ -1,9 +1,19 @@
 from typing import Optional
+import functools
 import os
 
 from src.sandbox.factory import get_sandbox
 
 
+@functools.lru_cache(maxsize=1)
+def _default_timeout() -> int:
+    """SANDBOX_TIMEOUT_SEC, read once per process (falls back to 30)."""
+    try:
+        return int(os.getenv("SANDBOX_TIMEOUT_SEC", "30"))
+    except ValueError:
+        return 30
+
+
 def run_python_code(code: str, timeout: Optional[int] = None) -> str:
     """
     Execute Python code using the configured sandbox.
@@ -18,9 +28,7 @@ def run_python_code(code: str, timeout: Optional[int] = None) -> str:
     sandbox = get_sandbox()
 
     try:
-        effective_timeout = (
-            int(timeout) if timeout is not None else int(os.getenv("SANDBOX_TIMEOUT_SEC", "30"))
-        )
+        effective_timeout = int(timeout) if timeout is not None else _default_timeout()
     except Exception:
         effective_timeout = 30
 
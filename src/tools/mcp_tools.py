@@ -10,10 +10,10 @@ These tools allow the agent to:
 - Get help and documentation for MCP tools
 """
 
-import json
+import io
 from typing import Any, Dict, List, Optional
 
-from src.config import settings
+from src.config import json_dumps, settings
 
 
 def list_mcp_servers() -> str:
@@ -32,8 +32,6 @@ def list_mcp_servers() -> str:
          2. database (http) - Disconnected ✗ - Error: Connection refused"
     """
     try:
-        from src.mcp_client import MCPClientManager
-
         # Try to get the global manager instance
         # This will be set by the agent during initialization
         manager = _get_mcp_manager()
@@ -51,25 +49,23 @@ def list_mcp_servers() -> str:
         if not status.get("servers"):
             return "No MCP servers configured. Add servers to mcp_servers.json"
 
-        lines = ["📡 MCP Servers Status:\n"]
+        buf = io.StringIO()
+        write = buf.write
+        write("📡 MCP Servers Status:\n")
 
         for i, (name, info) in enumerate(status["servers"].items(), 1):
             status_icon = "✅" if info["connected"] else "❌"
             status_text = "Connected" if info["connected"] else "Disconnected"
 
-            line = f"  {i}. {name} ({info['transport']}) - {status_text} {status_icon}"
+            write(f"\n  {i}. {name} ({info['transport']}) - {status_text} {status_icon}")
 
             if info["connected"]:
-                line += f" - {info['tools_count']} tools"
+                write(f" - {info['tools_count']} tools")
             elif info.get("error"):
-                line += f"\n     Error: {info['error']}"
-
-            lines.append(line)
+                write(f"\n     Error: {info['error']}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-    except ImportError:
-        return "MCP library not installed. Run: pip install 'mcp[cli]'"
     except Exception as e:
         return f"Error getting MCP status: {e}"
 
@@ -101,40 +97,33 @@ def list_mcp_tools(server_name: Optional[str] = None) -> str:
         if manager is None:
             return "MCP integration is not initialized."
 
-        tools = manager.get_all_tools()
+        tools_by_server: Dict[str, List[Any]] = manager.get_tools_by_server()
 
-        if not tools:
+        if not tools_by_server:
             return "No MCP tools available. Check server connections."
 
-        # Group tools by server
-        tools_by_server: Dict[str, List[Any]] = {}
-        for tool in tools:
-            if server_name and tool.server_name != server_name:
-                continue
+        if server_name:
+            if server_name not in tools_by_server:
+                return f"No tools found for server: {server_name}"
+            tools_by_server = {server_name: tools_by_server[server_name]}
 
-            if tool.server_name not in tools_by_server:
-                tools_by_server[tool.server_name] = []
-            tools_by_server[tool.server_name].append(tool)
-
-        if not tools_by_server:
-            return f"No tools found for server: {server_name}"
-
-        lines = ["🔧 Available MCP Tools:\n"]
+        prefix = settings.MCP_TOOL_PREFIX
+        buf = io.StringIO()
+        write = buf.write
+        write("🔧 Available MCP Tools:\n")
 
         for srv_name, srv_tools in tools_by_server.items():
-            lines.append(f"\n[{srv_name}] {len(srv_tools)} tool(s):")
+            write(f"\n\n[{srv_name}] {len(srv_tools)} tool(s):")
 
             for tool in srv_tools:
-                prefixed_name = tool.get_prefixed_name(settings.MCP_TOOL_PREFIX)
                 desc = (
                     tool.description[:60] + "..."
                     if len(tool.description) > 60
                     else tool.description
                 )
-                lines.append(f"  • {prefixed_name}")
-                lines.append(f"    {desc}")
+                write(f"\n  • {tool.get_prefixed_name(prefix)}\n    {desc}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     except Exception as e:
         return f"Error listing MCP tools: {e}"
@@ -172,31 +161,29 @@ def get_mcp_tool_help(tool_name: str) -> str:
         if not search_name.startswith(settings.MCP_TOOL_PREFIX):
             search_name = settings.MCP_TOOL_PREFIX + search_name
 
-        tools = manager.get_all_tools()
+        tool = manager.find_tool(search_name) or manager.find_tool(tool_name)
 
-        for tool in tools:
+        if tool is not None:
             prefixed_name = tool.get_prefixed_name(settings.MCP_TOOL_PREFIX)
+            lines = [
+                f"📖 Tool: {prefixed_name}",
+                f"   Server: {tool.server_name}",
+                f"   Original Name: {tool.original_name}",
+                "",
+                "Description:",
+                f"   {tool.description}",
+                "",
+                "Input Schema:",
+            ]
+
+            if tool.input_schema:
+                schema_str = json_dumps(tool.input_schema, indent=True).decode("utf-8")
+                for line in schema_str.split("\n"):
+                    lines.append(f"   {line}")
+            else:
+                lines.append("   No schema defined")
 
-            if prefixed_name == search_name or tool.original_name == tool_name:
-                lines = [
-                    f"📖 Tool: {prefixed_name}",
-                    f"   Server: {tool.server_name}",
-                    f"   Original Name: {tool.original_name}",
-                    "",
-                    "Description:",
-                    f"   {tool.description}",
-                    "",
-                    "Input Schema:",
-                ]
-
-                if tool.input_schema:
-                    schema_str = json.dumps(tool.input_schema, indent=2)
-                    for line in schema_str.split("\n"):
-                        lines.append(f"   {line}")
-                else:
-                    lines.append("   No schema defined")
-
-                return "\n".join(lines)
+            return "\n".join(lines)
 
         return (
             f"Tool not found: {tool_name}\nUse list_mcp_tools() to see available tools."
@@ -1,7 +1,40 @@
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
-import requests
+from src.config import json_dumps, json_loads
+from src.tools._http import get_async_client, get_session
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _build_generate_request(
+    prompt: str,
+    model: str,
+    host: str,
+    stream: bool,
+    options: Optional[Dict[str, Any]],
+) -> Tuple[str, bytes]:
+    # Serialized here (with orjson when installed), not by the HTTP client
+    url = f"{host.rstrip('/')}/api/generate"
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stream,
+    }
+    if options:
+        payload["options"] = options
+    return url, json_dumps(payload)
+
+
+def _generate_text(data: Any) -> str:
+    # Ollama /api/generate responses may contain 'response' or 'output' fields
+    text = data.get("response") or data.get("output") or data
+    if not isinstance(text, str):
+        try:
+            text = json.dumps(text, ensure_ascii=False)
+        except Exception:
+            text = str(text)
+    return text.strip()
 
 
 def call_local_ollama(
@@ -24,27 +57,94 @@ def call_local_ollama(
     Returns:
         The generated text response from the local model.
     """
-    url = f"{host.rstrip('/')}/api/generate"
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": stream,
-    }
-    if options:
-        payload["options"] = options
+    if stream:
+        # Streamed replies are NDJSON; collect them into one string
+        return "".join(call_local_ollama_stream(prompt, model, host, options)).strip()
+
+    url, body = _build_generate_request(prompt, model, host, stream, options)
 
     try:
-        resp = requests.post(url, json=payload, timeout=60)
+        resp = get_session().post(url, data=body, headers=_JSON_HEADERS, timeout=60)
         resp.raise_for_status()
         data = resp.json()
     except Exception as exc:
         return f"[call_local_ollama] request failed: {exc}"
 
-    # Ollama /api/generate responses may contain 'response' or 'output' fields
-    text = data.get("response") or data.get("output") or data
-    if not isinstance(text, str):
-        try:
-            text = json.dumps(text, ensure_ascii=False)
-        except Exception:
-            text = str(text)
-    return text.strip()
+    return _generate_text(data)
+
+
+async def acall_local_ollama(
+    prompt: str,
+    model: str = "qwen3:0.6b",
+    host: str = "http://127.0.0.1:11434",
+    stream: bool = False,
+    options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Async variant of call_local_ollama for concurrent requests.
+
+    Uses the shared httpx.AsyncClient, so several generations can be awaited
+    together with asyncio.gather. Arguments and return value match
+    call_local_ollama. Await src.tools._http.aclose_async_client() before
+    the event loop ends to close that client.
+    """
+    url, body = _build_generate_request(prompt, model, host, stream, options)
+
+    try:
+        resp = await get_async_client().post(url, content=body, headers=_JSON_HEADERS, timeout=60)
+        resp.raise_for_status()
+        if stream:
+            # Streamed replies are NDJSON; collect them into one string
+            return "".join(
+                json_loads(line).get("response", "") for line in resp.text.splitlines() if line
+            ).strip()
+        data = resp.json()
+    except Exception as exc:
+        return f"[call_local_ollama] request failed: {exc}"
+
+    return _generate_text(data)
+
+
+def call_local_ollama_stream(
+    prompt: str,
+    model: str = "qwen3:0.6b",
+    host: str = "http://127.0.0.1:11434",
+    options: Optional[Dict[str, Any]] = None,
+    on_chunk: Optional[Callable[[str], Any]] = None,
+) -> Iterator[str]:
+    """
+    Stream a local Ollama /api/generate response as it is produced.
+
+    Reads the NDJSON stream line by line and yields each 'response' piece.
+    Closing the generator (or stopping via on_chunk) drops the connection so
+    the server stops generating.
+
+    Args:
+        prompt: The prompt to send.
+        model: Model name (e.g., 'qwen3:0.6b').
+        host: Base URL of the local server (default http://127.0.0.1:11434).
+        options: Extra options passed through to the backend.
+        on_chunk: Optional callback run on every chunk before it is yielded;
+            a truthy return value ends the stream without yielding that chunk.
+
+    Yields:
+        Text chunks, or a single error message on failure.
+    """
+    url, body = _build_generate_request(prompt, model, host, True, options)
+
+    try:
+        with get_session().post(url, data=body, headers=_JSON_HEADERS, timeout=60, stream=True) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                data = json_loads(line)
+                text = data.get("response")
+                if text:
+                    if on_chunk is not None and on_chunk(text):
+                        return
+                    yield text
+                if data.get("done"):
+                    return
+    except Exception as exc:
+        yield f"[call_local_ollama] request failed: {exc}"
@@ -5,30 +5,24 @@ completion endpoint (including OpenAI, Azure OpenAI, or self-hosted
 providers like Ollama/Llama.cpp that expose the same API).
 """
 
-from typing import Optional, List, Dict, Any
-import requests
+from typing import Callable, Iterator, Optional, List, Dict, Any, Tuple, Union
+from src.config import json_dumps, json_loads, settings
+from src.tools._http import get_async_client, get_session, gzip_body
 
-from src.config import settings
 
-
-def call_openai_chat(
+def _build_chat_request(
     prompt: str,
-    system: Optional[str] = None,
-    model: Optional[str] = None,
-    temperature: float = 0.7,
-    max_tokens: int = 512,
-) -> str:
-    """Call an OpenAI-compatible chat completion API.
+    system: Optional[str],
+    model: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    stream: bool = False,
+) -> Union[str, Tuple[str, Dict[str, str], bytes]]:
+    """Return (url, headers, JSON body) for a chat completion, or a config error.
 
-    Args:
-        prompt: User prompt to send to the LLM.
-        system: Optional system prompt to set behavior or constraints.
-        model: Optional model override; defaults to settings.OPENAI_MODEL.
-        temperature: Sampling temperature.
-        max_tokens: Maximum tokens to generate (as supported by the backend).
-
-    Returns:
-        The text content returned by the LLM, or an error message on failure.
+    The body is serialized here (with orjson when installed) rather than by
+    the HTTP client's stdlib encoder, and gzipped when
+    ``settings.HTTP_COMPRESS_REQUESTS`` is on and it is large.
     """
     base_url = settings.OPENAI_BASE_URL.rstrip("/")
     api_key = settings.OPENAI_API_KEY
@@ -55,19 +49,149 @@ def call_openai_chat(
         "temperature": temperature,
         "max_tokens": max_tokens,
     }
+    if stream:
+        payload["stream"] = True
+
+    body = json_dumps(payload)
+    if settings.HTTP_COMPRESS_REQUESTS:
+        body = gzip_body(body, headers)
+    return url, headers, body
+
+
+def _chat_content(data: Dict[str, Any]) -> str:
+    choice = data.get("choices", [{}])[0]
+    message = choice.get("message", {})
+    content = message.get("content")
+    if content:
+        return content
+    return str(data)
+
+
+def call_openai_chat(
+    prompt: str,
+    system: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: int = 512,
+) -> str:
+    """Call an OpenAI-compatible chat completion API.
+
+    Args:
+        prompt: User prompt to send to the LLM.
+        system: Optional system prompt to set behavior or constraints.
+        model: Optional model override; defaults to settings.OPENAI_MODEL.
+        temperature: Sampling temperature.
+        max_tokens: Maximum tokens to generate (as supported by the backend).
+
+    Returns:
+        The text content returned by the LLM, or an error message on failure.
+    """
+    import requests
+
+    request = _build_chat_request(prompt, system, model, temperature, max_tokens)
+    if isinstance(request, str):
+        return request
+    url, headers, body = request
 
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = get_session().post(url, data=body, headers=headers, timeout=30)
         response.raise_for_status()
-        data = response.json()
-        choice = data.get("choices", [{}])[0]
-        message = choice.get("message", {})
-        content = message.get("content")
-        if content:
-            return content
-        return str(data)
+        return _chat_content(response.json())
     except requests.RequestException as exc:
         return f"Error calling OpenAI-compatible API: {exc}"
     except ValueError:
         # JSON decode failed
         return f"Error: Could not parse JSON response: {response.text[:500]}"
+
+
+async def acall_openai_chat(
+    prompt: str,
+    system: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: int = 512,
+) -> str:
+    """Async variant of :func:`call_openai_chat` for concurrent requests.
+
+    Uses the shared ``httpx.AsyncClient``, so several completions can be
+    awaited together with ``asyncio.gather``. Arguments and return value
+    match :func:`call_openai_chat`. Await
+    :func:`src.tools._http.aclose_async_client` before the event loop ends
+    to close that client.
+    """
+    import httpx
+
+    request = _build_chat_request(prompt, system, model, temperature, max_tokens)
+    if isinstance(request, str):
+        return request
+    url, headers, body = request
+
+    try:
+        response = await get_async_client().post(url, content=body, headers=headers, timeout=30)
+        response.raise_for_status()
+        return _chat_content(response.json())
+    except httpx.HTTPError as exc:
+        return f"Error calling OpenAI-compatible API: {exc}"
+    except ValueError:
+        # JSON decode failed
+        return f"Error: Could not parse JSON response: {response.text[:500]}"
+
+
+def call_openai_chat_stream(
+    prompt: str,
+    system: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: int = 512,
+    on_chunk: Optional[Callable[[str], Any]] = None,
+) -> Iterator[str]:
+    """Stream an OpenAI-compatible chat completion token by token.
+
+    Sends ``"stream": true`` and yields each ``choices[0].delta.content``
+    from the server-sent events as it arrives. Closing the generator (or
+    stopping via ``on_chunk``) drops the connection, so the server can stop
+    generating.
+
+    Args:
+        prompt: User prompt to send to the LLM.
+        system: Optional system prompt to set behavior or constraints.
+        model: Optional model override; defaults to settings.OPENAI_MODEL.
+        temperature: Sampling temperature.
+        max_tokens: Maximum tokens to generate (as supported by the backend).
+        on_chunk: Optional callback run on every chunk before it is yielded;
+            a truthy return value ends the stream without yielding that chunk.
+
+    Yields:
+        Text chunks, or a single error message on failure.
+    """
+    import requests
+
+    request = _build_chat_request(prompt, system, model, temperature, max_tokens, stream=True)
+    if isinstance(request, str):
+        yield request
+        return
+    url, headers, body = request
+
+    try:
+        with get_session().post(
+            url, data=body, headers=headers, timeout=30, stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                data = line[5:].strip()
+                if data == b"[DONE]":
+                    return
+                choices = json_loads(data).get("choices") or [{}]
+                text = (choices[0].get("delta") or {}).get("content")
+                if not text:
+                    continue
+                if on_chunk is not None and on_chunk(text):
+                    return
+                yield text
+    except requests.RequestException as exc:
+        yield f"Error calling OpenAI-compatible API: {exc}"
+    except ValueError as exc:
+        # JSON decode failed
+        yield f"Error: Could not parse streamed response: {exc}"
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for src/sandbox/inproc.py"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.sandbox.inproc import InProcessSandbox, _compile_checked
+
+
+class TestCompileChecked:
+    """Test the AST whitelist that decides what runs in process."""
+
+    @pytest.mark.parametrize("code", [
+        "print(6 * 7)",
+        "import math\nprint(math.sqrt(16))",
+        "from itertools import permutations\nprint(len(list(permutations('abc'))))",
+        "xs = [3, 1, 2]\nxs.sort()\nprint(xs)",
+        "name = 'x'\nprint(f'{name!r}: {3.14159:.2f}')",
+    ])
+    def test_accepts_simple_snippets(self, code):
+        """Plain arithmetic, containers and pure modules stay in process."""
+        assert _compile_checked(code) is not None
+
+    @pytest.mark.parametrize("code", [
+        "import os",
+        "import string",
+        "import functools",
+        "from string import Formatter",
+        "from functools import update_wrapper",
+        "print(().__class__.__base__.__subclasses__())",
+        "print('{0.__class__}'.format(1))",
+        "print(open('/etc/passwd').read())",
+        "import math\nmath.pi = 3",
+        "def f():\n    pass",
+    ])
+    def test_rejects_unsafe_snippets(self, code):
+        """Imports, dunders, str.format and definitions go out of process."""
+        assert _compile_checked(code) is None
+
+    def test_rejects_formatter_get_field_escape(self):
+        """Formatter.get_field cannot walk to object.__subclasses__."""
+        code = (
+            "import string\n"
+            "f = string.Formatter().get_field('0.__class__.__base__.__subclasses__', [1], {})[0]\n"
+            "print(len(f()))"
+        )
+        assert _compile_checked(code) is None
+        assert _compile_checked("x = y.get_field('0', [1], {})") is None
+
+    def test_rejects_update_wrapper_module_mutation(self):
+        """functools.update_wrapper cannot copy attributes onto a module."""
+        code = (
+            "import functools, math\n"
+            "functools.update_wrapper(math, functools, assigned=(), updated=('__dict__',))"
+        )
+        assert _compile_checked(code) is None
+
+    def test_rejects_generator_frame_escape(self):
+        """A generator's frame cannot be used to reach the host's globals."""
+        code = "g = (g.gi_frame.f_back.f_back.f_globals for _ in [1])\nprint(next(g))"
+        assert _compile_checked(code) is None
+
+
+class TestInProcessSandbox:
+    """Test routing between inline execution and LocalSandbox."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sandbox = InProcessSandbox()
+
+    def test_runs_simple_snippet_inline(self):
+        """A vetted snippet runs in process."""
+        result = self.sandbox.execute("import math\nprint(math.factorial(5))")
+        assert result.stdout == "120\n"
+        assert result.exit_code == 0
+        assert result.meta["runtime"] == "inproc"
+
+    def test_escape_attempt_falls_back_to_local(self):
+        """Rejected snippets run on LocalSandbox and leave the host untouched."""
+        code = (
+            "import functools, math\n"
+            "functools.update_wrapper(math, functools, assigned=(), updated=('__dict__',))"
+        )
+        result = self.sandbox.execute(code)
+        assert result.meta["runtime"] == "local"
+        assert not hasattr(math, "partial")
+
+    def test_output_past_cap_keeps_exit_code(self):
+        """Chatty snippets are truncated but still report a clean exit."""
+        result = self.sandbox.execute("for i in range(10 ** 5):\n    print(i)")
+        assert result.meta["runtime"] == "inproc"
+        assert result.exit_code == 0
+        assert result.meta["truncated"]
+        assert result.stdout.endswith("... (output truncated)")
+
+    @pytest.mark.parametrize("code", [
+        "x = " + "1+" * 100000 + "1",
+        "x = " + "-" * 100000 + "1",
+    ], ids=["binop_chain", "unary_chain"])
+    def test_deeply_nested_snippet_falls_back_to_local(self, code):
+        """Input too deep for the parser runs on LocalSandbox instead of raising."""
+        assert _compile_checked(code) is None
+        result = self.sandbox.execute(code)
+        assert result.meta["runtime"] == "local"
+        assert result.exit_code != 0
+
+    def test_print_accepts_file_keyword(self):
+        """print(..., file=None) behaves like the real builtin."""
+        result = self.sandbox.execute("print('a', 'b', sep='-', file=None, flush=True)")
+        assert result.meta["runtime"] == "inproc"
+        assert result.stdout == "a-b\n"
+        assert result.exit_code == 0
+
+    def test_timeout_is_reported(self):
+        """A runaway loop is stopped and reported as a timeout."""
+        result = self.sandbox.execute("while True:\n    pass", timeout=1)
+        assert result.meta["runtime"] == "inproc"
+        assert result.meta["timed_out"]
+        assert result.exit_code == -1
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for src/agents/router_agent.py"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.router_agent import RouterAgent
+
+
+class TestSimpleDelegate:
+    """Test the offline keyword routing fallback."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.router = RouterAgent()
+
+    def roles(self, task):
+        return [d["agent"] for d in self.router._simple_delegate(task)]
+
+    @pytest.mark.parametrize("task, expected", [
+        ("Write a function", ["coder"]),
+        ("The feature is implemented", ["coder"]),
+        ("Rebuild the codebase", ["coder"]),
+        ("Code was analyzed for security", ["coder", "reviewer"]),
+        ("Checkout the branch", ["reviewer"]),
+        ("Find information for the learner", ["researcher"]),
+        ("Hello there", ["coder"]),
+    ])
+    def test_keywords_match_as_substrings(self, task, expected):
+        """Inflected and compound words route like their stems."""
+        assert self.roles(task) == expected
+
+    def test_delegation_keeps_original_task(self):
+        """Each delegation carries the untouched task text."""
+        task = "Review THIS Code"
+        assert self.router._simple_delegate(task) == [
+            {"agent": "coder", "task": task},
+            {"agent": "reviewer", "task": task},
+        ]
+
+
+class TestAnalyzeAndDelegate:
+    """Test parsing of the router's delegation plan."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.router = RouterAgent()
+
+    def plan(self, analysis):
+        with patch.object(RouterAgent, "execute", return_value=analysis):
+            return self.router.analyze_and_delegate("task")
+
+    def test_parses_plan_lines(self):
+        """Indented lines and trailing whitespace are accepted."""
+        analysis = "Plan:\n  - agent: coder \r\n  - task: write it\n- agent: reviewer\n- task:  check it  \n"
+        assert self.plan(analysis) == [
+            {"agent": "coder", "task": "write it"},
+            {"agent": "reviewer", "task": "check it"},
+        ]
+
+    def test_requires_exact_prefix(self):
+        """Only "- agent:" / "- task:" lines count; others fall back to keywords."""
+        analysis = "-agent: coder\n- agent : reviewer\n- task: review it\n"
+        assert self.plan(analysis) == [{"agent": "coder", "task": "task"}]
+
+    def test_skips_delegation_without_task(self):
+        """An agent line without a task line is dropped."""
+        analysis = "- agent: coder\n- agent: reviewer\n- task: check it\n"
+        assert self.plan(analysis) == [{"agent": "reviewer", "task": "check it"}]